@@ -2,6 +2,7 @@ package handler
 
 import (
 	"backend/internal/model"
+	"fmt"
 	"net/http"
 
 	"gorm.io/gorm"
@@ -16,14 +17,60 @@ func (h *Handler) GetGuildPrefix(c *gin.Context) {
 	err := h.db.Where("guild_id = ?", guildID).First(&guild).Error
 	if err != nil {
 		if err == gorm.ErrRecordNotFound {
-			c.JSON(http.StatusOK, gin.H{"prefix": "!"})
+			respond(c, http.StatusOK, gin.H{"prefix": "!"})
 			return
 		}
 		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{"prefix": guild.Prefix})
+	respond(c, http.StatusOK, gin.H{"prefix": guild.Prefix})
+}
+
+func (h *Handler) GetGuildSettings(c *gin.Context) {
+	guildID := c.Param("guildID")
+
+	var guild model.Guild
+	err := h.db.Where("guild_id = ?", guildID).First(&guild).Error
+	if err != nil {
+		if err == gorm.ErrRecordNotFound {
+			respond(c, http.StatusOK, model.Guild{GuildID: guildID, Prefix: "!", MusicVolume: 100})
+			return
+		}
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	respond(c, http.StatusOK, guild)
+}
+
+// maxBulkGuildIDs caps how many guilds a single bulk settings request may ask for
+const maxBulkGuildIDs = 1000
+
+func (h *Handler) GetGuildSettingsBulk(c *gin.Context) {
+	var body struct {
+		GuildIDs []string `json:"guild_ids" binding:"required"`
+	}
+
+	if err := c.ShouldBind(&body); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	if len(body.GuildIDs) > maxBulkGuildIDs {
+		c.JSON(http.StatusBadRequest, gin.H{"error": fmt.Sprintf("at most %d guild ids per request", maxBulkGuildIDs)})
+		return
+	}
+
+	guilds := []model.Guild{}
+	if len(body.GuildIDs) > 0 {
+		if err := h.db.Where("guild_id IN ?", body.GuildIDs).Find(&guilds).Error; err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+	}
+
+	respond(c, http.StatusOK, guilds)
 }
 
 func (h *Handler) UpdateGuildPrefix(c *gin.Context) {
@@ -33,7 +80,7 @@ func (h *Handler) UpdateGuildPrefix(c *gin.Context) {
 		Prefix string `json:"prefix" binding:"required"`
 	}
 
-	if err := c.ShouldBindJSON(&body); err != nil {
+	if err := c.ShouldBind(&body); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
@@ -50,5 +97,5 @@ func (h *Handler) UpdateGuildPrefix(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, guild)
+	respond(c, http.StatusOK, guild)
 }
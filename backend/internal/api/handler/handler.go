@@ -1,6 +1,13 @@
 package handler
 
-import "backend/internal/database"
+import (
+	"backend/internal/database"
+	"net/http"
+
+	"github.com/gin-gonic/gin"
+	"github.com/gin-gonic/gin/binding"
+	"github.com/gin-gonic/gin/render"
+)
 
 type Handler struct {
 	db *database.Database
@@ -9,3 +16,22 @@ type Handler struct {
 func New(db *database.Database) *Handler {
 	return &Handler{db: db}
 }
+
+// respond writes obj as msgpack when the client prefers it via Accept, and as JSON otherwise
+func respond(c *gin.Context, code int, obj interface{}) {
+	switch c.NegotiateFormat(binding.MIMEJSON, binding.MIMEMSGPACK, binding.MIMEMSGPACK2) {
+	case binding.MIMEMSGPACK, binding.MIMEMSGPACK2:
+		c.Render(code, render.MsgPack{Data: obj})
+	default:
+		c.JSON(code, obj)
+	}
+}
+
+func (h *Handler) Health(c *gin.Context) {
+	if err := h.db.Ping(); err != nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"status": "unavailable", "error": err.Error()})
+		return
+	}
+
+	c.JSON(http.StatusOK, gin.H{"status": "ok"})
+}
@@ -2,14 +2,38 @@ package handler
 
 import (
 	"backend/internal/model"
+	"fmt"
 	"net/http"
+	"strconv"
+	"time"
 
 	"github.com/gin-gonic/gin"
+	"gorm.io/gorm"
 )
 
+// bulkInsertBatchSize caps the number of rows per INSERT statement for bulk writes
+const bulkInsertBatchSize = 500
+
+// recentMessagesLimit is how many messages the recent message endpoints return
+const recentMessagesLimit = 10
+
+// recentMessages builds the query for a guild's newest messages, restricted to
+// the last max_age seconds when that query parameter is given
+func (h *Handler) recentMessages(c *gin.Context) (*gorm.DB, error) {
+	query := h.db.Where("guild_id = ?", c.Param("guildID"))
+	if raw := c.Query("max_age"); raw != "" {
+		maxAge, err := strconv.Atoi(raw)
+		if err != nil || maxAge < 0 {
+			return nil, fmt.Errorf("invalid max_age %q", raw)
+		}
+		query = query.Where("created_at > ?", time.Now().Add(-time.Duration(maxAge)*time.Second))
+	}
+	return query.Order("created_at desc").Limit(recentMessagesLimit), nil
+}
+
 func (h *Handler) StoreDeletedMessage(c *gin.Context) {
 	var msg model.DeletedMessage
-	if err := c.ShouldBindJSON(&msg); err != nil {
+	if err := c.ShouldBind(&msg); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
@@ -19,30 +43,45 @@ func (h *Handler) StoreDeletedMessage(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusCreated, msg)
+	respond(c, http.StatusCreated, msg)
 }
 
-func (h *Handler) GetRecentDeletedMessages(c *gin.Context) {
-	guildID := c.Param("guildID")
-	limit := 10 // Could make this configurable
+func (h *Handler) StoreDeletedMessages(c *gin.Context) {
+	var msgs []model.DeletedMessage
+	if err := c.ShouldBind(&msgs); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
 
-	var messages []model.DeletedMessage
-	err := h.db.Where("guild_id = ?", guildID).
-		Order("created_at desc").
-		Limit(limit).
-		Find(&messages)
+	if len(msgs) > 0 {
+		if err := h.db.CreateInBatches(&msgs, bulkInsertBatchSize); err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+	}
 
+	respond(c, http.StatusCreated, gin.H{"stored": len(msgs)})
+}
+
+func (h *Handler) GetRecentDeletedMessages(c *gin.Context) {
+	query, err := h.recentMessages(c)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error.Error()})
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
 
-	c.JSON(http.StatusOK, messages)
+	var messages []model.DeletedMessage
+	if err := query.Find(&messages).Error; err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	respond(c, http.StatusOK, messages)
 }
 
 func (h *Handler) StoreEditedMessage(c *gin.Context) {
 	var msg model.EditedMessage
-	if err := c.ShouldBindJSON(&msg); err != nil {
+	if err := c.ShouldBind(&msg); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
@@ -52,23 +91,38 @@ func (h *Handler) StoreEditedMessage(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusCreated, msg)
+	respond(c, http.StatusCreated, msg)
 }
 
-func (h *Handler) GetRecentEditedMessages(c *gin.Context) {
-	guildID := c.Param("guildID")
-	limit := 10 // Could make this configurable
+func (h *Handler) StoreEditedMessages(c *gin.Context) {
+	var msgs []model.EditedMessage
+	if err := c.ShouldBind(&msgs); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
 
-	var messages []model.EditedMessage
-	err := h.db.Where("guild_id = ?", guildID).
-		Order("created_at desc").
-		Limit(limit).
-		Find(&messages)
+	if len(msgs) > 0 {
+		if err := h.db.CreateInBatches(&msgs, bulkInsertBatchSize); err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+	}
+
+	respond(c, http.StatusCreated, gin.H{"stored": len(msgs)})
+}
 
+func (h *Handler) GetRecentEditedMessages(c *gin.Context) {
+	query, err := h.recentMessages(c)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error.Error()})
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	var messages []model.EditedMessage
+	if err := query.Find(&messages).Error; err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
 
-	c.JSON(http.StatusOK, messages)
+	respond(c, http.StatusOK, messages)
 }
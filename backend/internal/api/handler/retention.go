@@ -0,0 +1,54 @@
+package handler
+
+import (
+	"fmt"
+	"net/http"
+	"time"
+
+	"github.com/gin-gonic/gin"
+)
+
+// messageTables are the captured message tables subject to retention
+var messageTables = []string{"deleted_messages", "edited_messages"}
+
+const (
+	pruneExpiredSQL = "DELETE FROM %[1]s WHERE id IN (SELECT id FROM %[1]s WHERE created_at < ? LIMIT ?)"
+	pruneOverCapSQL = "DELETE FROM %[1]s WHERE id IN (" +
+		"SELECT id FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY created_at DESC, id DESC) AS rn " +
+		"FROM %[1]s) ranked WHERE rn > ? LIMIT ?)"
+)
+
+// PruneMessages hard-deletes captured messages older than max_age seconds and
+// trims every guild to its newest per_guild_cap messages, batch_size rows per statement
+func (h *Handler) PruneMessages(c *gin.Context) {
+	var params struct {
+		MaxAge      int `form:"max_age" binding:"required,min=1"`
+		PerGuildCap int `form:"per_guild_cap" binding:"required,min=1"`
+		BatchSize   int `form:"batch_size,default=5000" binding:"min=1,max=50000"`
+	}
+
+	if err := c.ShouldBindQuery(&params); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	cutoff := time.Now().Add(-time.Duration(params.MaxAge) * time.Second)
+	var deleted int64
+	for _, table := range messageTables {
+		// Expire by age first so the per-guild ranking only scans what is left
+		expired, err := h.db.ExecInBatches(fmt.Sprintf(pruneExpiredSQL, table), params.BatchSize, cutoff)
+		if err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+
+		overCap, err := h.db.ExecInBatches(fmt.Sprintf(pruneOverCapSQL, table), params.BatchSize, params.PerGuildCap)
+		if err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+		deleted += expired + overCap
+	}
+
+	respond(c, http.StatusOK, gin.H{"deleted": deleted})
+}
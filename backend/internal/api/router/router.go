@@ -9,15 +9,22 @@ import (
 func Setup(h *handler.Handler) *gin.Engine {
 	r := gin.Default()
 
+	r.GET("/health", h.Health)
+
 	// Guild routes
 	r.GET("/guilds/:guildID/prefix", h.GetGuildPrefix)
 	r.PUT("/guilds/:guildID/prefix", h.UpdateGuildPrefix)
+	r.GET("/guilds/:guildID/settings", h.GetGuildSettings)
+	r.POST("/guilds/settings/bulk", h.GetGuildSettingsBulk)
 
 	// Message routes
 	r.POST("/messages/deleted", h.StoreDeletedMessage)
+	r.POST("/messages/deleted/bulk", h.StoreDeletedMessages)
 	r.GET("/guilds/:guildID/messages/deleted", h.GetRecentDeletedMessages)
 	r.POST("/messages/edited", h.StoreEditedMessage)
+	r.POST("/messages/edited/bulk", h.StoreEditedMessages)
 	r.GET("/guilds/:guildID/messages/edited", h.GetRecentEditedMessages)
+	r.DELETE("/messages/expired", h.PruneMessages)
 
 	return r
 }
@@ -4,6 +4,7 @@ package database
 import (
 	"backend/internal/config"
 	"backend/internal/model"
+	"fmt"
 
 	"gorm.io/driver/postgres"
 	"gorm.io/gorm"
@@ -23,14 +24,40 @@ func New(cfg *config.Config) (*Database, error) {
 		return nil, err
 	}
 
+	if err := createRetentionIndexes(db); err != nil {
+		return nil, err
+	}
+
 	return &Database{db: db}, nil
 }
 
+// createRetentionIndexes adds the indexes behind recent message lookups and
+// retention pruning, which gorm tags cannot express on the embedded CreatedAt
+func createRetentionIndexes(db *gorm.DB) error {
+	for _, table := range []string{"deleted_messages", "edited_messages"} {
+		statements := []string{
+			fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%[1]s_guild_created ON %[1]s (guild_id, created_at)", table),
+			fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%[1]s_created ON %[1]s (created_at)", table),
+		}
+		for _, statement := range statements {
+			if err := db.Exec(statement).Error; err != nil {
+				return err
+			}
+		}
+	}
+	return nil
+}
+
 // Create inserts a new record into the database
 func (d *Database) Create(value interface{}) error {
 	return d.db.Create(value).Error
 }
 
+// CreateInBatches inserts a slice of records using multi-row inserts of batchSize rows
+func (d *Database) CreateInBatches(value interface{}, batchSize int) error {
+	return d.db.CreateInBatches(value, batchSize).Error
+}
+
 // Save updates a record in the database
 func (d *Database) Save(value interface{}) error {
 	return d.db.Save(value).Error
@@ -66,6 +93,32 @@ func (d *Database) FirstOrCreate(dest interface{}, conds ...interface{}) error {
 	return d.db.FirstOrCreate(dest, conds...).Error
 }
 
+// Ping checks that the underlying database connection is alive
+func (d *Database) Ping() error {
+	sqlDB, err := d.db.DB()
+	if err != nil {
+		return err
+	}
+	return sqlDB.Ping()
+}
+
+// ExecInBatches runs sql, whose last placeholder is a batch LIMIT, until it
+// affects fewer than batchSize rows and returns the total rows affected
+func (d *Database) ExecInBatches(sql string, batchSize int, values ...interface{}) (int64, error) {
+	args := append(values, batchSize)
+	var total int64
+	for {
+		result := d.db.Exec(sql, args...)
+		if result.Error != nil {
+			return total, result.Error
+		}
+		total += result.RowsAffected
+		if result.RowsAffected < int64(batchSize) {
+			return total, nil
+		}
+	}
+}
+
 // Transaction starts a new transaction
 func (d *Database) Transaction(fc func(tx *gorm.DB) error) error {
 	return d.db.Transaction(fc)
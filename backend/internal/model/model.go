@@ -1,29 +1,63 @@
 package model
 
-import "gorm.io/gorm"
+import (
+	"time"
+
+	"gorm.io/gorm"
+)
 
 type Guild struct {
 	gorm.Model
-	GuildID     string `gorm:"uniqueIndex"`
-	Prefix      string `gorm:"default:'!'"`
-	MusicVolume int    `gorm:"default:100"`
+	GuildID     string `gorm:"uniqueIndex" json:"guild_id"`
+	Prefix      string `gorm:"default:'!'" json:"prefix"`
+	MusicVolume int    `gorm:"default:100" json:"music_volume"`
 }
 
 type DeletedMessage struct {
 	gorm.Model
-	GuildID   string
-	ChannelID string
-	MessageID string
-	Content   string
-	AuthorID  string
+	GuildID   string `json:"guild_id"`
+	ChannelID string `json:"channel_id"`
+	MessageID string `json:"message_id"`
+	Content   string `json:"content"`
+	AuthorID  string `json:"author_id"`
+	// CapturedAt is when the bot saw the deletion, in Unix seconds
+	CapturedAt float64 `gorm:"-" json:"captured_at,omitempty"`
+}
+
+// BeforeCreate keeps the capture time as CreatedAt, so records the bot
+// replays after an outage are not treated as new by retention or snipes
+func (m *DeletedMessage) BeforeCreate(tx *gorm.DB) error {
+	m.CreatedAt = capturedTime(m.CapturedAt, m.CreatedAt)
+	return nil
 }
 
 type EditedMessage struct {
 	gorm.Model
-	GuildID    string
-	ChannelID  string
-	MessageID  string
-	OldContent string
-	NewContent string
-	AuthorID   string
+	GuildID    string `json:"guild_id"`
+	ChannelID  string `json:"channel_id"`
+	MessageID  string `json:"message_id"`
+	OldContent string `json:"old_content"`
+	NewContent string `json:"new_content"`
+	AuthorID   string `json:"author_id"`
+	// CapturedAt is when the bot saw the edit, in Unix seconds
+	CapturedAt float64 `gorm:"-" json:"captured_at,omitempty"`
+}
+
+// BeforeCreate keeps the capture time as CreatedAt, see DeletedMessage
+func (m *EditedMessage) BeforeCreate(tx *gorm.DB) error {
+	m.CreatedAt = capturedTime(m.CapturedAt, m.CreatedAt)
+	return nil
+}
+
+// capturedTime converts a capture timestamp, falling back to createdAt when
+// none was sent and clamping it to now so a skewed clock cannot extend retention
+func capturedTime(capturedAt float64, createdAt time.Time) time.Time {
+	if capturedAt <= 0 {
+		return createdAt
+	}
+	captured := time.Unix(0, int64(capturedAt*float64(time.Second)))
+	if now := time.Now(); captured.After(now) {
+		return now
+	}
+	return captured
 }
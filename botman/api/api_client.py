@@ -1,85 +1,272 @@
 import aiohttp
 import logging
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
+
+from config import APIConfig
+from api.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from api.codec import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPES,
+    MsgPackCodec,
+    MsgPackListDecoder,
+    get_codec,
+    loads_json,
+)
+from api.guild_settings import GuildSettings
+from api.storage import Storage
+from cache.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
-class APIClient:
-    def __init__(self, base_url: str):
-        self.base_url = base_url.rstrip('/')
-        
-    async def get_guild_prefix(self, guild_id: str) -> str:
-        """Get custom prefix for a guild."""
-        async with aiohttp.ClientSession() as session:
+class APIClient(Storage):
+    """Storage backed by the Go API service over pooled HTTP."""
+
+    def __init__(self, config: APIConfig):
+        super().__init__(config)
+        self.base_url = config.base_url.rstrip('/')
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.breaker = CircuitBreaker(
+            "backend",
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout,
+        )
+        self._inflight_gets: SingleFlight[str, Tuple[int, Any]] = SingleFlight()
+        self.codec = get_codec(config.wire_format)
+        self._accept = self.codec.content_type
+        if self.codec.content_type != JSON_CONTENT_TYPE:
+            # Let the backend answer in JSON if it cannot negotiate the preferred format
+            self._accept += f", {JSON_CONTENT_TYPE};q=0.9"
+
+    async def start(self) -> None:
+        """Open the pooled HTTP session used by every request."""
+        if self._session is not None and not self._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.config.pool_size,
+            limit_per_host=self.config.pool_size_per_host,
+            ttl_dns_cache=self.config.dns_cache_ttl,
+            keepalive_timeout=self.config.keepalive_timeout,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.config.request_timeout,
+            connect=self.config.connect_timeout,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        logger.info(f"API client session opened for {self.base_url}")
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session and release its connections."""
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+        logger.info("API client session closed")
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it if an event arrives before startup."""
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        stream_list: bool = False,
+    ) -> Tuple[int, Any]:
+        """
+        Send a request through the circuit breaker and return its status and decoded body.
+
+        Payloads are encoded with the configured wire format and responses are
+        decoded according to the Content-Type the backend negotiated.
+
+        Raises:
+            CircuitOpenError: If the backend is currently considered unhealthy.
+        """
+        # Encoded before asking the breaker, an encoding error must not hold a half-open probe
+        headers = {"Accept": self._accept}
+        body = None
+        if payload is not None:
+            body = self.codec.encode(payload)
+            headers["Content-Type"] = self.codec.content_type
+
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"Backend circuit is open, skipping {method} {path}")
+        probing = self.breaker.state is CircuitState.HALF_OPEN
+
+        try:
+            session = await self._get_session()
             try:
-                async with session.get(f"{self.base_url}/guilds/{guild_id}/prefix") as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data["prefix"]
-                    return "!"  # Default prefix on failure
-            except Exception as e:
-                logger.error(f"Failed to get guild prefix: {e}")
-                return "!"
+                async with session.request(method, f"{self.base_url}{path}", data=body, headers=headers) as resp:
+                    data = await self._decode_response(resp, stream_list)
+            except Exception:
+                self.breaker.record_failure()
+                raise
+
+            if resp.status >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            return resp.status, data
+        finally:
+            # A probe that ended without an outcome (cancelled, or failed before sending) must not block later ones
+            if probing:
+                self.breaker.release_probe()
+
+    @staticmethod
+    async def _decode_response(resp: aiohttp.ClientResponse, stream_list: bool) -> Any:
+        """
+        Decode the response body according to its content type.
+
+        ``stream_list`` only applies to msgpack bodies, whose list items are
+        unpacked as the chunks arrive. JSON bodies are always read in full and
+        parsed at once, neither the stdlib nor orjson parses incrementally, so
+        large lists only stream with the msgpack wire format.
+        """
+        # The backend only answers in msgpack when asked to, which requires msgpack to be installed
+        if resp.content_type in MSGPACK_CONTENT_TYPES:
+            if not stream_list:
+                return MsgPackCodec().decode(await resp.read())
+
+            decoder = MsgPackListDecoder()
+            async for chunk in resp.content.iter_chunked(65_536):
+                decoder.feed(chunk)
+            return decoder.items
+
+        if resp.content_type == JSON_CONTENT_TYPE:
+            return loads_json(await resp.read())
+        return None
+
+    async def _get(self, path: str, stream_list: bool = False) -> Tuple[int, Any]:
+        """GET ``path``, sharing one in-flight request between identical concurrent calls."""
+        return await self._inflight_gets.do(path, lambda: self._request("GET", path, stream_list=stream_list))
+
+    async def health_check(self) -> bool:
+        """Return whether the backend is reachable and healthy."""
+        try:
+            status, _ = await self._get("/health")
+            return status == 200
+        except Exception:
+            return False
+
+    async def get_guild_settings(self, guild_id: str) -> GuildSettings:
+        """Get all settings for a guild, served from the settings cache when possible."""
+        settings = self.settings_cache.get(guild_id)
+        if settings is not None:
+            return settings
+
+        try:
+            status, data = await self._get(f"/guilds/{guild_id}/settings")
+            if status == 200:
+                settings = GuildSettings.from_dict(data)
+                self.settings_cache.set(guild_id, settings)
+                return settings
+        except CircuitOpenError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to get guild settings: {e}")
+
+        # Serve stale settings (e.g. from the startup snapshot) before falling back to defaults
+        return self.settings_cache.peek(guild_id) or GuildSettings(guild_id)
+
+    async def get_guild_settings_bulk(self, guild_ids: List[str]) -> Optional[List[GuildSettings]]:
+        """Get the stored settings of many guilds in one request, or None on failure."""
+        try:
+            status, data = await self._request("POST", "/guilds/settings/bulk", payload={"guild_ids": guild_ids})
+            return [GuildSettings.from_dict(entry) for entry in data] if status == 200 else None
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get settings for {len(guild_ids)} guilds: {e}")
+            return None
 
     async def set_guild_prefix(self, guild_id: str, prefix: str) -> bool:
         """Set custom prefix for a guild."""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.put(
-                    f"{self.base_url}/guilds/{guild_id}/prefix",
-                    json={"prefix": prefix}
-                ) as resp:
-                    return resp.status == 200
-            except Exception as e:
-                logger.error(f"Failed to set guild prefix: {e}")
-                return False
+        try:
+            status, data = await self._request("PUT", f"/guilds/{guild_id}/prefix", payload={"prefix": prefix})
+            if status == 200:
+                settings = GuildSettings.from_dict(data) if data else GuildSettings(guild_id, prefix=prefix)
+                self.settings_cache.set(guild_id, settings)
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"Failed to set guild prefix: {e}")
+            return False
 
     async def store_deleted_message(self, message_data: Dict) -> bool:
         """Store a deleted message."""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/messages/deleted",
-                    json=message_data
-                ) as resp:
-                    return resp.status == 201
-            except Exception as e:
-                logger.error(f"Failed to store deleted message: {e}")
-                return False
+        try:
+            status, _ = await self._request("POST", "/messages/deleted", payload=message_data)
+            return status == 201
+        except Exception as e:
+            logger.error(f"Failed to store deleted message: {e}")
+            return False
 
     async def store_edited_message(self, message_data: Dict) -> bool:
         """Store an edited message."""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    f"{self.base_url}/messages/edited",
-                    json=message_data
-                ) as resp:
-                    return resp.status == 201
-            except Exception as e:
-                logger.error(f"Failed to store edited message: {e}")
-                return False
-
-    async def get_recent_deleted_messages(self, guild_id: str) -> List[Dict]:
-        """Get recent deleted messages for a guild."""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"{self.base_url}/guilds/{guild_id}/messages/deleted") as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    return []
-            except Exception as e:
-                logger.error(f"Failed to get deleted messages: {e}")
-                return []
-
-    async def get_recent_edited_messages(self, guild_id: str) -> List[Dict]:
-        """Get recent edited messages for a guild."""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"{self.base_url}/guilds/{guild_id}/messages/edited") as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    return []
-            except Exception as e:
-                logger.error(f"Failed to get edited messages: {e}")
-                return []
\ No newline at end of file
+        try:
+            status, _ = await self._request("POST", "/messages/edited", payload=message_data)
+            return status == 201
+        except Exception as e:
+            logger.error(f"Failed to store edited message: {e}")
+            return False
+
+    async def store_deleted_messages(self, messages: List[Dict]) -> bool:
+        """Store a batch of deleted messages in a single request."""
+        try:
+            status, _ = await self._request("POST", "/messages/deleted/bulk", payload=messages)
+            return status == 201
+        except Exception as e:
+            logger.error(f"Failed to store {len(messages)} deleted messages: {e}")
+            return False
+
+    async def store_edited_messages(self, messages: List[Dict]) -> bool:
+        """Store a batch of edited messages in a single request."""
+        try:
+            status, _ = await self._request("POST", "/messages/edited/bulk", payload=messages)
+            return status == 201
+        except Exception as e:
+            logger.error(f"Failed to store {len(messages)} edited messages: {e}")
+            return False
+
+    @staticmethod
+    def _recent_path(guild_id: str, kind: str, max_age: Optional[float]) -> str:
+        path = f"/guilds/{guild_id}/messages/{kind}"
+        return f"{path}?max_age={int(max_age)}" if max_age is not None else path
+
+    async def get_recent_deleted_messages(self, guild_id: str, max_age: Optional[float] = None) -> List[Dict]:
+        """Get recent deleted messages for a guild, optionally only those newer than ``max_age`` seconds."""
+        try:
+            status, data = await self._get(self._recent_path(guild_id, "deleted", max_age), stream_list=True)
+            return data if status == 200 else []
+        except CircuitOpenError:
+            return []
+        except Exception as e:
+            logger.error(f"Failed to get deleted messages: {e}")
+            return []
+
+    async def get_recent_edited_messages(self, guild_id: str, max_age: Optional[float] = None) -> List[Dict]:
+        """Get recent edited messages for a guild, optionally only those newer than ``max_age`` seconds."""
+        try:
+            status, data = await self._get(self._recent_path(guild_id, "edited", max_age), stream_list=True)
+            return data if status == 200 else []
+        except CircuitOpenError:
+            return []
+        except Exception as e:
+            logger.error(f"Failed to get edited messages: {e}")
+            return []
+
+    async def prune_messages(self, max_age: float, per_guild_cap: int, batch_size: int) -> Optional[int]:
+        """Ask the backend to delete expired and over-cap captured messages."""
+        path = f"/messages/expired?max_age={int(max_age)}&per_guild_cap={per_guild_cap}&batch_size={batch_size}"
+        try:
+            status, data = await self._request("DELETE", path)
+            return data.get("deleted", 0) if status == 200 else None
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to prune messages: {e}")
+            return None
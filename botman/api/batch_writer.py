@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import typing
+
+logger = logging.getLogger(__name__)
+
+FlushCallback = typing.Callable[[typing.List[typing.Dict]], typing.Awaitable[bool]]
+FallbackCallback = typing.Callable[[typing.List[typing.Dict]], typing.Awaitable[None]]
+
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    Write-behind buffer that collects records and flushes them in batches.
+
+    Records are queued in memory and written through ``flush_callback`` once
+    ``max_batch_size`` records are waiting or ``flush_interval`` seconds have
+    passed since the first record of the batch arrived. The queue is bounded
+    by ``max_pending``; producers wait when it is full, which applies
+    backpressure instead of letting memory grow during event storms. Batches
+    that fail to flush are handed to ``fallback`` when one is configured.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_callback: FlushCallback,
+        max_batch_size: int = 100,
+        flush_interval: float = 2.0,
+        max_pending: int = 10_000,
+        fallback: typing.Optional[FallbackCallback] = None,
+    ) -> None:
+        self.name = name
+        self._flush_callback = flush_callback
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._fallback = fallback
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: typing.Optional[asyncio.Task] = None
+
+        self.flushed = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be flushed."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush every queued record and stop the background loop."""
+        if self._task is None or self._task.done():
+            return
+
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def put(self, record: typing.Dict) -> None:
+        """Queue a record, waiting for room if the buffer is full."""
+        await self._queue.put(record)
+
+    async def put_many(self, records: typing.Iterable[typing.Dict]) -> None:
+        """Queue several records in order."""
+        for record in records:
+            await self._queue.put(record)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self._flush_interval
+
+            while len(batch) < self._max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: typing.List[typing.Dict]) -> None:
+        try:
+            success = await self._flush_callback(batch)
+        except Exception as e:
+            logger.error(f"Failed to flush {self.name} batch: {e}")
+            success = False
+
+        if success:
+            self.flushed += len(batch)
+            return
+
+        self.failed += len(batch)
+        if self._fallback is None:
+            logger.warning(f"Dropped {len(batch)} {self.name} records after a failed flush")
+            return
+
+        try:
+            await self._fallback(batch)
+        except Exception as e:
+            logger.error(f"Fallback for {len(batch)} {self.name} records failed: {e}")
@@ -0,0 +1,82 @@
+import enum
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit breaker is open."""
+
+
+class CircuitState(enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Tracks backend failures and short-circuits requests while it is unhealthy.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects every request for ``reset_timeout`` seconds. It then half-opens and
+    lets a single probe through: a success closes the breaker again, a failure
+    re-opens it for another ``reset_timeout``.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent to the backend right now."""
+        if self._state is CircuitState.CLOSED:
+            return True
+
+        if self._state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                self.rejected += 1
+                return False
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"Circuit {self.name} half-open, probing backend")
+
+        if self._probe_in_flight:
+            self.rejected += 1
+            return False
+
+        self._probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        """Let another probe through, for a request that ended without recording an outcome."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self._state is not CircuitState.CLOSED:
+            logger.info(f"Circuit {self.name} closed, backend recovered")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state is not CircuitState.OPEN:
+                logger.warning(f"Circuit {self.name} open after {self._failures} failures")
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,110 @@
+from abc import ABC, abstractmethod
+import json
+import logging
+import typing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/x-msgpack"
+MSGPACK_CONTENT_TYPES = (MSGPACK_CONTENT_TYPE, "application/msgpack")
+
+
+def dumps_json(obj: typing.Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads_json(data: typing.Union[bytes, str]) -> typing.Any:
+    """Deserialize JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class Codec(ABC):
+    """Serializer for one wire format used between the bot and the backend."""
+
+    name: str = ""
+    content_type: str = ""
+
+    @abstractmethod
+    def encode(self, obj: typing.Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> typing.Any:
+        pass
+
+
+class JSONCodec(Codec):
+    name = "json"
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, obj: typing.Any) -> bytes:
+        return dumps_json(obj)
+
+    def decode(self, data: bytes) -> typing.Any:
+        return loads_json(data)
+
+
+class MsgPackCodec(Codec):
+    name = "msgpack"
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def encode(self, obj: typing.Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, data: bytes) -> typing.Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class MsgPackListDecoder:
+    """
+    Incrementally decodes a msgpack array as its bytes arrive.
+
+    Items are unpacked as soon as they are complete, so decoding a large list
+    overlaps with reading it from the network instead of happening in one
+    burst after the whole body has been buffered.
+    """
+
+    def __init__(self) -> None:
+        self._unpacker = msgpack.Unpacker(raw=False)
+        self._remaining: typing.Optional[int] = None
+        self.items: typing.List[typing.Any] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self._unpacker.feed(chunk)
+        try:
+            if self._remaining is None:
+                self._remaining = self._unpacker.read_array_header()
+            while self._remaining:
+                self.items.append(self._unpacker.unpack())
+                self._remaining -= 1
+        except msgpack.OutOfData:
+            pass
+
+    @property
+    def complete(self) -> bool:
+        return self._remaining == 0
+
+
+def get_codec(name: str) -> Codec:
+    """Return the codec for ``name``, falling back to JSON if msgpack is unavailable."""
+    if name == MsgPackCodec.name:
+        if msgpack is not None:
+            return MsgPackCodec()
+        logger.warning("msgpack wire format requested but msgpack is not installed, using JSON")
+    return JSONCodec()
@@ -0,0 +1,22 @@
+import typing
+from dataclasses import dataclass
+
+DEFAULT_PREFIX = "!"
+DEFAULT_MUSIC_VOLUME = 100
+
+
+@dataclass
+class GuildSettings:
+    """Per-guild settings stored by the backend."""
+
+    guild_id: str
+    prefix: str = DEFAULT_PREFIX
+    music_volume: int = DEFAULT_MUSIC_VOLUME
+
+    @classmethod
+    def from_dict(cls, data: typing.Mapping[str, typing.Any]) -> "GuildSettings":
+        return cls(
+            guild_id=str(data["guild_id"]),
+            prefix=data.get("prefix") or DEFAULT_PREFIX,
+            music_volume=data.get("music_volume", DEFAULT_MUSIC_VOLUME),
+        )
@@ -0,0 +1,59 @@
+import json
+import logging
+import os
+import typing
+
+from api.guild_settings import GuildSettings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class SettingsSnapshot:
+    """
+    Compact on-disk copy of cached guild settings used to warm the cache on startup.
+
+    Settings are stored as ``[guild_id, prefix, music_volume]`` rows and the
+    file is replaced atomically, so a crash mid-write never leaves a torn
+    snapshot behind.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def load(self) -> typing.List[GuildSettings]:
+        """Read the snapshot, returning an empty list if it is missing or unreadable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as snapshot:
+                data = json.load(snapshot)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable settings snapshot {self.path}: {e}")
+            return []
+
+        if data.get("version") != SNAPSHOT_VERSION:
+            logger.warning(f"Ignoring settings snapshot with unknown version {data.get('version')}")
+            return []
+
+        return [
+            GuildSettings(guild_id=guild_id, prefix=prefix, music_volume=music_volume)
+            for guild_id, prefix, music_volume in data.get("guilds", [])
+        ]
+
+    def save(self, settings: typing.Iterable[GuildSettings]) -> int:
+        """Atomically write ``settings`` to disk and return how many were written."""
+        rows = [[entry.guild_id, entry.prefix, entry.music_volume] for entry in settings]
+        tmp_path = self.path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as snapshot:
+            json.dump({"version": SNAPSHOT_VERSION, "guilds": rows}, snapshot, separators=(",", ":"))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, self.path)
+
+        return len(rows)
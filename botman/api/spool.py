@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+import typing
+
+from api.codec import dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+ReplayCallback = typing.Callable[[typing.List[typing.Dict]], typing.Awaitable[bool]]
+HealthCheck = typing.Callable[[], typing.Awaitable[bool]]
+
+_SEGMENT_SUFFIX = ".log"
+
+
+class MessageSpool:
+    """
+    Append-only, segmented on-disk log for capture records the backend could not accept.
+
+    Records are written as JSON lines tagged with their kind (``deleted`` or
+    ``edited``) to the active segment, which is rotated once it reaches
+    ``segment_bytes``. ``fsync`` is batched to at most once per
+    ``fsync_interval`` seconds. When the spool grows past ``max_bytes`` the
+    oldest closed segments are dropped. A background replayer drains closed
+    segments in bulk once the backend reports healthy again, deleting fully
+    replayed segments and compacting partially replayed ones.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 4_194_304,
+        max_bytes: int = 268_435_456,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        self.directory = directory
+        self._segment_bytes = segment_bytes
+        self._max_bytes = max_bytes
+        self._fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._active: typing.Optional[typing.BinaryIO] = None
+        self._active_seq = 0
+        self._dirty = False
+        self._last_fsync = 0.0
+        self._replay_task: typing.Optional[asyncio.Task] = None
+        # Segment the replayer is draining, never evicted by the size cap
+        self._replaying: typing.Optional[int] = None
+
+        self.spooled = 0
+        self.replayed = 0
+        self.dropped = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        sequences = self._sequences()
+        self._active_seq = sequences[-1] + 1 if sequences else 0
+        # Kept up to date on every write, compaction and removal instead of statting each segment
+        self._bytes = self._size()
+
+    # Segment bookkeeping
+
+    def _sequences(self) -> typing.List[int]:
+        sequences = []
+        for name in os.listdir(self.directory):
+            if name.endswith(_SEGMENT_SUFFIX):
+                try:
+                    sequences.append(int(name[:-len(_SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(sequences)
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{seq:012d}{_SEGMENT_SUFFIX}")
+
+    def _closed_sequences(self) -> typing.List[int]:
+        return [seq for seq in self._sequences() if self._active is None or seq != self._active_seq]
+
+    def _size(self) -> int:
+        return sum(os.path.getsize(self._path(seq)) for seq in self._sequences())
+
+    @property
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._active is None and not self._sequences()
+
+    # Writing
+
+    async def append(self, kind: str, records: typing.List[typing.Dict]) -> None:
+        """Append ``records`` of ``kind`` to the spool without blocking the event loop."""
+        if not records:
+            return
+
+        payload = b"".join(
+            dumps_json({"kind": kind, "record": record}) + b"\n"
+            for record in records
+        )
+        await asyncio.to_thread(self._append_sync, payload, len(records))
+
+    def _append_sync(self, payload: bytes, count: int) -> None:
+        with self._lock:
+            if self._active is None:
+                self._active = open(self._path(self._active_seq), "ab")
+
+            self._active.write(payload)
+            self._bytes += len(payload)
+            self._dirty = True
+            self.spooled += count
+
+            if self._active.tell() >= self._segment_bytes:
+                self._rotate_locked()
+            elif time.monotonic() - self._last_fsync >= self._fsync_interval:
+                self._fsync_locked()
+
+            self._enforce_cap_locked()
+
+    def _fsync_locked(self) -> None:
+        if self._active is not None and self._dirty:
+            self._active.flush()
+            os.fsync(self._active.fileno())
+            self._dirty = False
+        self._last_fsync = time.monotonic()
+
+    def _rotate_locked(self) -> None:
+        if self._active is None:
+            return
+
+        self._fsync_locked()
+        self._active.close()
+        self._active = None
+        self._active_seq += 1
+
+    def _enforce_cap_locked(self) -> None:
+        if self._bytes <= self._max_bytes:
+            return
+
+        for seq in self._closed_sequences():
+            if self._bytes <= self._max_bytes:
+                return
+            if seq == self._replaying:
+                continue
+
+            path = self._path(seq)
+            segment_size = os.path.getsize(path)
+            with open(path, "rb") as segment:
+                lost = sum(1 for _ in segment)
+            os.remove(path)
+            self._bytes -= segment_size
+            self.dropped += lost
+            logger.warning(f"Spool over {self._max_bytes} bytes, dropped segment {seq} with {lost} records")
+
+    def sync(self) -> None:
+        """Force pending writes to disk."""
+        with self._lock:
+            self._fsync_locked()
+
+    def close(self) -> None:
+        """Sync and close the active segment."""
+        with self._lock:
+            self._rotate_locked()
+
+    # Replaying
+
+    async def replay(self, callbacks: typing.Mapping[str, ReplayCallback], batch_size: int = 500) -> bool:
+        """
+        Drain spooled records through ``callbacks`` keyed by record kind.
+
+        Returns True when the spool was fully drained, False if a callback
+        failed and the remaining records were kept for a later attempt.
+        """
+        await asyncio.to_thread(self.close)
+
+        try:
+            for seq in await asyncio.to_thread(self._closed_sequences):
+                if not await asyncio.to_thread(self._claim, seq):
+                    continue
+
+                path = self._path(seq)
+                lines = await asyncio.to_thread(self._read_lines, path)
+
+                position = 0
+                while position < len(lines):
+                    end, kind, records = self._take_run(lines, position, batch_size)
+                    if not await self._replay_run(kind, records, callbacks):
+                        await asyncio.to_thread(self._compact, path, lines[position:])
+                        return False
+                    self.replayed += end - position
+                    position = end
+
+                await asyncio.to_thread(self._remove, path)
+                logger.info(f"Replayed spool segment {seq} ({len(lines)} records)")
+        finally:
+            self._replaying = None
+
+        return True
+
+    def _claim(self, seq: int) -> bool:
+        """Protect ``seq`` from cap eviction while it is replayed, False if it was already evicted."""
+        with self._lock:
+            self._replaying = seq
+            return os.path.exists(self._path(seq))
+
+    def _remove(self, path: str) -> None:
+        with self._lock:
+            self._bytes -= os.path.getsize(path)
+            os.remove(path)
+
+    @staticmethod
+    def _read_lines(path: str) -> typing.List[bytes]:
+        with open(path, "rb") as segment:
+            return [line for line in segment if line.strip()]
+
+    @staticmethod
+    def _take_run(
+        lines: typing.List[bytes],
+        start: int,
+        batch_size: int,
+    ) -> typing.Tuple[int, typing.Optional[str], typing.List[typing.Dict]]:
+        """
+        Up to ``batch_size`` consecutive records of a single kind from ``start`` on.
+
+        Runs never mix kinds, so when a callback fails every line before the
+        run has been accepted and only the run onwards needs to be kept.
+        Returns the position after the run, its kind and its records.
+        """
+        kind: typing.Optional[str] = None
+        records: typing.List[typing.Dict] = []
+        position = start
+        while position < len(lines) and len(records) < batch_size:
+            try:
+                entry = loads_json(lines[position])
+            except ValueError:
+                logger.warning("Skipping corrupt spool entry")
+                position += 1
+                continue
+            if kind is not None and entry["kind"] != kind:
+                break
+            kind = entry["kind"]
+            records.append(entry["record"])
+            position += 1
+        return position, kind, records
+
+    @staticmethod
+    async def _replay_run(
+        kind: typing.Optional[str],
+        records: typing.List[typing.Dict],
+        callbacks: typing.Mapping[str, ReplayCallback],
+    ) -> bool:
+        if not records:
+            return True
+        callback = callbacks.get(kind)
+        if callback is None:
+            logger.warning(f"No replay handler for spooled {kind} records, skipping {len(records)}")
+            return True
+        return await callback(records)
+
+    def _compact(self, path: str, remaining: typing.List[bytes]) -> None:
+        """Rewrite a partially replayed segment so it only holds unreplayed records."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as segment:
+            segment.writelines(remaining)
+            segment.flush()
+            os.fsync(segment.fileno())
+        with self._lock:
+            self._bytes -= os.path.getsize(path) - os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+
+    def start_replayer(
+        self,
+        callbacks: typing.Mapping[str, ReplayCallback],
+        health_check: HealthCheck,
+        interval: float = 10.0,
+        batch_size: int = 500,
+    ) -> None:
+        """Periodically sync the spool and drain it while the backend is healthy."""
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(
+                self._replay_loop(callbacks, health_check, interval, batch_size)
+            )
+
+    async def stop_replayer(self) -> None:
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            try:
+                await self._replay_task
+            except asyncio.CancelledError:
+                pass
+            self._replay_task = None
+        await asyncio.to_thread(self.close)
+
+    async def _replay_loop(
+        self,
+        callbacks: typing.Mapping[str, ReplayCallback],
+        health_check: HealthCheck,
+        interval: float,
+        batch_size: int,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.sync)
+                if self.is_empty or not await health_check():
+                    continue
+                await self.replay(callbacks, batch_size)
+            except Exception as e:
+                logger.error(f"Spool replay failed: {e}")
@@ -0,0 +1,289 @@
+import logging
+import os
+import time
+import typing
+
+import aiosqlite
+
+from config import APIConfig
+from api.guild_settings import DEFAULT_MUSIC_VOLUME, GuildSettings
+from api.storage import Storage
+
+logger = logging.getLogger(__name__)
+
+# Same number of rows the backend returns for recent message lookups
+RECENT_MESSAGES_LIMIT = 10
+
+# SQLite caps bound parameters per statement, so IN (...) lookups are chunked
+_MAX_IN_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS guilds (
+    guild_id TEXT PRIMARY KEY,
+    prefix TEXT NOT NULL DEFAULT '!',
+    music_volume INTEGER NOT NULL DEFAULT 100,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS deleted_messages (
+    id INTEGER PRIMARY KEY,
+    guild_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    content TEXT,
+    author_id TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deleted_messages_guild_created
+    ON deleted_messages (guild_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_deleted_messages_created
+    ON deleted_messages (created_at);
+
+CREATE TABLE IF NOT EXISTS edited_messages (
+    id INTEGER PRIMARY KEY,
+    guild_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    old_content TEXT,
+    new_content TEXT,
+    author_id TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_edited_messages_guild_created
+    ON edited_messages (guild_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_edited_messages_created
+    ON edited_messages (created_at);
+"""
+
+# Statements are kept as constants so sqlite3's statement cache reuses their prepared form
+_SELECT_GUILD = "SELECT guild_id, prefix, music_volume FROM guilds WHERE guild_id = ?"
+_UPSERT_PREFIX = (
+    "INSERT INTO guilds (guild_id, prefix, music_volume, created_at, updated_at) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (guild_id) DO UPDATE SET prefix = excluded.prefix, updated_at = excluded.updated_at "
+    "RETURNING guild_id, prefix, music_volume"
+)
+_INSERT_DELETED = (
+    "INSERT INTO deleted_messages (guild_id, channel_id, message_id, content, author_id, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_EDITED = (
+    "INSERT INTO edited_messages (guild_id, channel_id, message_id, old_content, new_content, author_id, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_RECENT_DELETED = (
+    "SELECT guild_id, channel_id, message_id, content, author_id FROM deleted_messages "
+    "WHERE guild_id = ? AND created_at > ? ORDER BY created_at DESC LIMIT ?"
+)
+_SELECT_RECENT_EDITED = (
+    "SELECT guild_id, channel_id, message_id, old_content, new_content, author_id FROM edited_messages "
+    "WHERE guild_id = ? AND created_at > ? ORDER BY created_at DESC LIMIT ?"
+)
+
+_MESSAGE_TABLES = ("deleted_messages", "edited_messages")
+_PRUNE_EXPIRED = "DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE created_at < ? LIMIT ?)"
+_PRUNE_OVER_CAP = (
+    "DELETE FROM {table} WHERE id IN ("
+    "SELECT id FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY created_at DESC, id DESC) AS rn "
+    "FROM {table}) WHERE rn > ? LIMIT ?)"
+)
+
+
+def _captured_at(message: typing.Dict, now: float) -> float:
+    """When the bot captured ``message``, so records replayed from the spool keep their age."""
+    return min(message.get("captured_at") or now, now)
+
+
+class SQLiteStorage(Storage):
+    """
+    Storage backed by a local SQLite database for single-node deployments.
+
+    The database runs in WAL mode so snipe lookups are not blocked by capture
+    writes, and batches are inserted with ``executemany`` in one transaction.
+    Rows are returned in the same shape as the HTTP backend's responses.
+    """
+
+    def __init__(self, config: APIConfig) -> None:
+        super().__init__(config)
+        self.path = config.sqlite_path
+        self._db: typing.Optional[aiosqlite.Connection] = None
+
+    async def start(self) -> None:
+        """Open the database and create the schema if needed."""
+        if self._db is not None:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = await aiosqlite.connect(self.path, cached_statements=256)
+        self._db.row_factory = aiosqlite.Row
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent with NORMAL, only the last commits may be lost on power failure
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.executescript(_SCHEMA)
+        await self._db.commit()
+        logger.info(f"SQLite storage opened at {self.path}")
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._db is None:
+            return
+
+        await self._db.close()
+        self._db = None
+        logger.info("SQLite storage closed")
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Return the open connection, opening it if an event arrives before startup."""
+        if self._db is None:
+            await self.start()
+        return self._db
+
+    async def health_check(self) -> bool:
+        """Return whether the database answers queries."""
+        try:
+            db = await self._get_db()
+            async with db.execute("SELECT 1"):
+                return True
+        except Exception:
+            return False
+
+    async def get_guild_settings(self, guild_id: str) -> GuildSettings:
+        """Get all settings for a guild, served from the settings cache when possible."""
+        settings = self.settings_cache.get(guild_id)
+        if settings is not None:
+            return settings
+
+        try:
+            db = await self._get_db()
+            async with db.execute(_SELECT_GUILD, (guild_id,)) as cursor:
+                row = await cursor.fetchone()
+            settings = GuildSettings.from_dict(dict(row)) if row else GuildSettings(guild_id)
+            self.settings_cache.set(guild_id, settings)
+            return settings
+        except Exception as e:
+            logger.error(f"Failed to get guild settings: {e}")
+            return self.settings_cache.peek(guild_id) or GuildSettings(guild_id)
+
+    async def get_guild_settings_bulk(self, guild_ids: typing.List[str]) -> typing.Optional[typing.List[GuildSettings]]:
+        """Get the stored settings of many guilds, or None on failure."""
+        try:
+            db = await self._get_db()
+            settings = []
+            for start in range(0, len(guild_ids), _MAX_IN_PARAMS):
+                chunk = guild_ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"SELECT guild_id, prefix, music_volume FROM guilds WHERE guild_id IN ({placeholders})"
+                async with db.execute(query, chunk) as cursor:
+                    settings.extend(GuildSettings.from_dict(dict(row)) for row in await cursor.fetchall())
+            return settings
+        except Exception as e:
+            logger.error(f"Failed to get settings for {len(guild_ids)} guilds: {e}")
+            return None
+
+    async def set_guild_prefix(self, guild_id: str, prefix: str) -> bool:
+        """Set custom prefix for a guild."""
+        now = time.time()
+        try:
+            db = await self._get_db()
+            async with db.execute(_UPSERT_PREFIX, (guild_id, prefix, DEFAULT_MUSIC_VOLUME, now, now)) as cursor:
+                row = await cursor.fetchone()
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to set guild prefix: {e}")
+            return False
+
+        self.settings_cache.set(guild_id, GuildSettings.from_dict(dict(row)))
+        return True
+
+    async def _insert_many(self, statement: str, rows: typing.List[typing.Tuple]) -> None:
+        db = await self._get_db()
+        try:
+            await db.executemany(statement, rows)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def store_deleted_messages(self, messages: typing.List[typing.Dict]) -> bool:
+        """Store a batch of deleted messages in a single transaction."""
+        now = time.time()
+        rows = [
+            (m["guild_id"], m["channel_id"], m["message_id"], m.get("content"), m["author_id"], _captured_at(m, now))
+            for m in messages
+        ]
+        try:
+            await self._insert_many(_INSERT_DELETED, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store {len(messages)} deleted messages: {e}")
+            return False
+
+    async def store_edited_messages(self, messages: typing.List[typing.Dict]) -> bool:
+        """Store a batch of edited messages in a single transaction."""
+        now = time.time()
+        rows = [
+            (m["guild_id"], m["channel_id"], m["message_id"], m.get("old_content"), m.get("new_content"), m["author_id"], _captured_at(m, now))
+            for m in messages
+        ]
+        try:
+            await self._insert_many(_INSERT_EDITED, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store {len(messages)} edited messages: {e}")
+            return False
+
+    async def _fetch_recent(
+        self,
+        statement: str,
+        guild_id: str,
+        max_age: typing.Optional[float],
+    ) -> typing.List[typing.Dict]:
+        cutoff = time.time() - max_age if max_age is not None else 0
+        db = await self._get_db()
+        async with db.execute(statement, (guild_id, cutoff, RECENT_MESSAGES_LIMIT)) as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def get_recent_deleted_messages(self, guild_id: str, max_age: typing.Optional[float] = None) -> typing.List[typing.Dict]:
+        """Get recent deleted messages for a guild, optionally only those newer than ``max_age`` seconds."""
+        try:
+            return await self._fetch_recent(_SELECT_RECENT_DELETED, guild_id, max_age)
+        except Exception as e:
+            logger.error(f"Failed to get deleted messages: {e}")
+            return []
+
+    async def get_recent_edited_messages(self, guild_id: str, max_age: typing.Optional[float] = None) -> typing.List[typing.Dict]:
+        """Get recent edited messages for a guild, optionally only those newer than ``max_age`` seconds."""
+        try:
+            return await self._fetch_recent(_SELECT_RECENT_EDITED, guild_id, max_age)
+        except Exception as e:
+            logger.error(f"Failed to get edited messages: {e}")
+            return []
+
+    async def _delete_in_batches(self, statement: str, value: typing.Any, batch_size: int) -> int:
+        """Run a batched DELETE until it stops matching, committing after every batch to keep write locks short."""
+        db = await self._get_db()
+        deleted = 0
+        while True:
+            async with db.execute(statement, (value, batch_size)) as cursor:
+                count = cursor.rowcount
+            await db.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+    async def prune_messages(self, max_age: float, per_guild_cap: int, batch_size: int) -> typing.Optional[int]:
+        """Delete expired and over-cap captured messages."""
+        cutoff = time.time() - max_age
+        deleted = 0
+        try:
+            for table in _MESSAGE_TABLES:
+                # Expire by age first so the per-guild ranking only scans what is left
+                deleted += await self._delete_in_batches(_PRUNE_EXPIRED.format(table=table), cutoff, batch_size)
+                deleted += await self._delete_in_batches(_PRUNE_OVER_CAP.format(table=table), per_guild_cap, batch_size)
+        except Exception as e:
+            logger.error(f"Failed to prune messages: {e}")
+            return None
+        return deleted
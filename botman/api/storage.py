@@ -0,0 +1,112 @@
+from abc import ABC, abstractmethod
+import typing
+
+from config import APIConfig
+from api.guild_settings import GuildSettings
+from cache.ttl_cache import TTLCache
+
+HTTP_BACKEND = "http"
+SQLITE_BACKEND = "sqlite"
+
+
+class Storage(ABC):
+    """
+    Persistence interface used by the bot for guild settings and captured messages.
+
+    Implementations share the in-memory settings cache and its bulk prefetch,
+    so handlers can warm and snapshot it without knowing where settings live.
+    """
+
+    def __init__(self, config: APIConfig) -> None:
+        self.config = config
+        self.settings_cache: TTLCache[str, GuildSettings] = TTLCache(
+            maxsize=config.settings_cache_size,
+            ttl=config.settings_cache_ttl,
+        )
+
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def health_check(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_guild_settings(self, guild_id: str) -> GuildSettings:
+        pass
+
+    @abstractmethod
+    async def get_guild_settings_bulk(self, guild_ids: typing.List[str]) -> typing.Optional[typing.List[GuildSettings]]:
+        pass
+
+    @abstractmethod
+    async def set_guild_prefix(self, guild_id: str, prefix: str) -> bool:
+        pass
+
+    async def store_deleted_message(self, message_data: typing.Dict) -> bool:
+        return await self.store_deleted_messages([message_data])
+
+    async def store_edited_message(self, message_data: typing.Dict) -> bool:
+        return await self.store_edited_messages([message_data])
+
+    @abstractmethod
+    async def store_deleted_messages(self, messages: typing.List[typing.Dict]) -> bool:
+        pass
+
+    @abstractmethod
+    async def store_edited_messages(self, messages: typing.List[typing.Dict]) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_recent_deleted_messages(self, guild_id: str, max_age: typing.Optional[float] = None) -> typing.List[typing.Dict]:
+        pass
+
+    @abstractmethod
+    async def get_recent_edited_messages(self, guild_id: str, max_age: typing.Optional[float] = None) -> typing.List[typing.Dict]:
+        pass
+
+    @abstractmethod
+    async def prune_messages(self, max_age: float, per_guild_cap: int, batch_size: int) -> typing.Optional[int]:
+        """
+        Delete captured messages older than ``max_age`` seconds or beyond the
+        newest ``per_guild_cap`` of their guild, ``batch_size`` rows at a time.
+
+        Returns the number of deleted rows, or None if pruning failed.
+        """
+        pass
+
+    async def get_guild_prefix(self, guild_id: str) -> str:
+        """Get custom prefix for a guild."""
+        settings = await self.get_guild_settings(guild_id)
+        return settings.prefix
+
+    async def prefetch_guild_settings(self, guild_ids: typing.List[str]) -> int:
+        """Warm the settings cache for ``guild_ids`` with a single bulk lookup."""
+        settings = await self.get_guild_settings_bulk(guild_ids)
+        if settings is None:
+            return 0
+
+        # Guilds without stored settings use the defaults, as in get_guild_settings
+        found = {entry.guild_id: entry for entry in settings}
+        for guild_id in guild_ids:
+            self.settings_cache.set(guild_id, found.get(guild_id) or GuildSettings(guild_id))
+        return len(guild_ids)
+
+
+def create_storage(config: APIConfig) -> Storage:
+    """Build the storage backend selected by ``config.storage_backend``."""
+    if config.storage_backend == SQLITE_BACKEND:
+        # Imported lazily, HTTP deployments only need aiosqlite for the music track catalog
+        from api.sqlite_storage import SQLiteStorage
+        return SQLiteStorage(config)
+
+    if config.storage_backend != HTTP_BACKEND:
+        raise ValueError(f"Unknown storage backend: {config.storage_backend}")
+
+    from api.api_client import APIClient
+    return APIClient(config)
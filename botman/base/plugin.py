@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
+import importlib
+import pathlib
 import typing
+import hikari
 import lightbulb
 from base.command import BaseCommand
 
 class BasePlugin(ABC):
     """Base class for all plugins"""
+
+    # Gateway intents and cache components the plugin's commands rely on
+    intents: hikari.Intents = hikari.Intents.NONE
+    cache_components: hikari.api.CacheComponents = hikari.api.CacheComponents.NONE
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Whether the plugin should be loaded"""
+        return True
     
     def __init__(self, bot: lightbulb.BotApp):
         self.bot = bot
@@ -43,3 +55,30 @@ class BasePlugin(ABC):
     def unload(self) -> None:
         """Unload plugin from bot"""
         self.bot.remove_plugin(self.plugin)
+
+
+
+def discover_plugins(directory: str = "plugins") -> typing.List[typing.Type[BasePlugin]]:
+    """
+    Import the extension modules lightbulb loads from ``directory`` and
+    return their enabled plugin classes.
+
+    Used before the bot connects to work out which intents and cache
+    components the loaded plugins need.
+    """
+    plugins = []
+    for path in sorted(pathlib.Path(directory).rglob("*.py")):
+        # lightbulb skips underscored modules when loading extensions
+        if path.name.startswith("_"):
+            continue
+
+        module = importlib.import_module(".".join(path.with_suffix("").parts))
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BasePlugin)
+                and value.__module__ == module.__name__
+                and value.is_enabled()
+            ):
+                plugins.append(value)
+    return plugins
@@ -0,0 +1,69 @@
+"""
+Measures serialization cost of the APIClient wire formats.
+
+Run from the botman directory:
+
+    python -m benchmarks.codec_benchmark [records] [rounds]
+"""
+import json
+import sys
+import timeit
+
+from api.codec import JSONCodec, MsgPackCodec, MsgPackListDecoder, msgpack, orjson
+
+
+def _records(count: int) -> list:
+    return [
+        {
+            "guild_id": "1234567890123456789",
+            "channel_id": "2345678901234567890",
+            "message_id": str(3456789012345678901 + i),
+            "old_content": f"message {i} before it was edited " * 3,
+            "new_content": f"message {i} after it was edited " * 3,
+            "author_id": "4567890123456789012",
+        }
+        for i in range(count)
+    ]
+
+
+def _report(name: str, encode, decode, records: list, rounds: int) -> None:
+    payload = encode(records)
+    encode_time = timeit.timeit(lambda: encode(records), number=rounds) / rounds
+    decode_time = timeit.timeit(lambda: decode(payload), number=rounds) / rounds
+    print(
+        f"{name:<16} {len(payload):>10,} B  "
+        f"encode {encode_time * 1000:8.3f} ms  decode {decode_time * 1000:8.3f} ms"
+    )
+
+
+def _stream_decode(payload: bytes, chunk_size: int = 65_536) -> list:
+    decoder = MsgPackListDecoder()
+    for start in range(0, len(payload), chunk_size):
+        decoder.feed(payload[start:start + chunk_size])
+    return decoder.items
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    records = _records(count)
+
+    print(f"{count} edited message records, {rounds} rounds")
+    _report("stdlib json", lambda obj: json.dumps(obj).encode(), json.loads, records, rounds)
+
+    if orjson is not None:
+        codec = JSONCodec()
+        _report("orjson", codec.encode, codec.decode, records, rounds)
+    else:
+        print("orjson           not installed")
+
+    if msgpack is not None:
+        codec = MsgPackCodec()
+        _report("msgpack", codec.encode, codec.decode, records, rounds)
+        _report("msgpack stream", codec.encode, _stream_decode, records, rounds)
+    else:
+        print("msgpack          not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures memory held per queued music track, full ongaku tracks against compact records.
+
+Run from the botman directory:
+
+    python -m benchmarks.queue_memory [tracks]
+"""
+import base64
+import gc
+import operator
+import sys
+import tracemalloc
+
+from ongaku.builders import EntityBuilder
+
+from plugins.music._queue import QueuedTrack
+from plugins.music._treap import IndexedQueue
+
+
+def _payloads(count: int) -> list:
+    return [
+        {
+            # Real encoded tracks are a few hundred bytes of base64
+            "encoded": base64.b64encode(f"track {i} ".encode() * 24).decode(),
+            "info": {
+                "identifier": f"dQw4w9WgX{i:06d}",
+                "isSeekable": True,
+                "author": f"Artist {i % 500}",
+                "length": 212_000 + i,
+                "isStream": False,
+                "position": 0,
+                "title": f"Song number {i} (Official Music Video)",
+                "uri": f"https://www.youtube.com/watch?v=dQw4w9WgX{i:06d}",
+                "artworkUrl": f"https://i.ytimg.com/vi/dQw4w9WgX{i:06d}/maxresdefault.jpg",
+                "isrc": None,
+                "sourceName": "youtube",
+            },
+            "pluginInfo": {},
+            "userData": {},
+        }
+        for i in range(count)
+    ]
+
+
+def _measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    builder = EntityBuilder()
+
+    full = _measure(lambda: [builder.build_track(payload) for payload in _payloads(count)])
+    # The backlog MusicQueues keeps: one treap node per record on top of the record itself
+    compact = _measure(lambda: IndexedQueue(
+        operator.attrgetter("length"),
+        [QueuedTrack.from_track(builder.build_track(payload)) for payload in _payloads(count)],
+    ))
+    encoded = _measure(lambda: [payload["encoded"] for payload in _payloads(count)])
+
+    print(f"{count} queued tracks")
+    for name, size in (("ongaku.Track", full), ("IndexedQueue", compact), ("encoded only", encoded)):
+        print(f"{name:<14} {size:>12,} B  {size / count:8.1f} B/track")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,36 @@
 import logging
+import typing
 import hikari
 import lightbulb
 import miru
 import ongaku
-import os
 
+from base.plugin import discover_plugins
 from help import HelpCommand
-from config import BotConfig, LavalinkConfig, LogConfig
-from api.api_client import APIClient
+from config import APIConfig, BotConfig, LavalinkConfig, LogConfig
+from api.storage import create_storage
 from handlers.session_handler import RetrySessionHandler
 from handlers.error_handler import ErrorHandler
 from handlers.message_handler import MessageHandler
+from handlers.guild_handler import GuildHandler
+from handlers.member_resolver import MemberResolver
 
 logger = logging.getLogger(__name__)
 
+# Needed regardless of plugins: guild lifecycle, prefix commands and message capture
+CORE_INTENTS = (
+    hikari.Intents.GUILDS
+    | hikari.Intents.GUILD_MESSAGES
+    | hikari.Intents.DM_MESSAGES
+    | hikari.Intents.MESSAGE_CONTENT
+)
+# Messages are left out on purpose, capture keeps its own compact message cache, see MessageHandler
+CORE_CACHE_COMPONENTS = (
+    hikari.api.CacheComponents.GUILDS
+    | hikari.api.CacheComponents.GUILD_CHANNELS
+    | hikari.api.CacheComponents.ME
+)
+
 
 class Bot(lightbulb.BotApp):
     """Main bot class with all core functionality."""
@@ -22,33 +39,55 @@ class Bot(lightbulb.BotApp):
         # Load configurations
         self.config = BotConfig()
         self.lavalink_config = LavalinkConfig()
+        self.api_config = APIConfig()
         self.log_config = LogConfig()
+        intents, cache_components = self._plugin_requirements()
+        if self.config.on_demand_members:
+            # Members are resolved through MemberResolver instead of chunking every guild on connect
+            cache_components &= ~hikari.api.CacheComponents.MEMBERS
 
         # Initialize the bot
         super().__init__(
             token=self.config.token,
             prefix=self._get_prefix,
             help_class=HelpCommand,
-            intents=hikari.Intents.ALL,
-            owner_ids=self.config.owner_ids
+            intents=intents,
+            owner_ids=self.config.owner_ids,
+            cache_settings=hikari.impl.CacheSettings(components=cache_components),
+            auto_chunk_members=not self.config.on_demand_members,
         )
         
         # Initialize handlers
         self.message_handler = MessageHandler(self)
+        self.guild_handler = GuildHandler(self)
+        self.member_resolver = MemberResolver(self)
         self.error_handler = ErrorHandler()
         
         # Setup components
         self._setup_logging()
         self._setup_integrations()
+        self.guild_handler.load_snapshot()
         self._load_extensions()
         self._register_events()
 
+    def _plugin_requirements(self) -> typing.Tuple[hikari.Intents, hikari.api.CacheComponents]:
+        """Combine the intents and cache components of every enabled plugin with the core ones."""
+        # Nothing else enables caches: a plugin has to declare every intent and cache component its
+        # commands and checks rely on, or it only works while some other plugin happens to declare them
+        intents = CORE_INTENTS | hikari.Intents(self.config.extra_intents)
+        cache_components = CORE_CACHE_COMPONENTS
+        for plugin in discover_plugins():
+            intents |= plugin.intents
+            cache_components |= plugin.cache_components
+        return intents, cache_components
+
     async def _get_prefix(self, bot, message: hikari.Message) -> str:
         """Get the prefix for the guild."""
         if not message.guild_id:
             return "!"
         
-        return await self.d.api_client.get_guild_prefix(str(message.guild_id))
+        settings = await self.d.api_client.get_guild_settings(str(message.guild_id))
+        return settings.prefix
 
     def _setup_logging(self) -> None:
         """Configure logging settings."""
@@ -69,14 +108,16 @@ class Bot(lightbulb.BotApp):
         
         # Setup Ongaku for music
         self.d.ongaku = ongaku.Client(self, session_handler=RetrySessionHandler)
-        self.d.ongaku.create_session(
-            name="default-session",
-            host=self.lavalink_config.host,
-            port=self.lavalink_config.port,
-            password=self.lavalink_config.password,
-        )
+        if self.lavalink_config.enabled:
+            for node in self.lavalink_config.nodes:
+                self.d.ongaku.create_session(
+                    name=node.name,
+                    host=node.host,
+                    port=node.port,
+                    password=self.lavalink_config.password,
+                )
 
-        self.d.api_client = APIClient(os.getenv("BOT_API_URL", "http://localhost:8080"))
+        self.d.api_client = create_storage(self.api_config)
     
         logger.info("Third-party integrations initialized")
 
@@ -92,15 +133,34 @@ class Bot(lightbulb.BotApp):
     def _register_events(self) -> None:
         """Register event handlers."""
         self.listen(hikari.StartedEvent)(self.on_started)
+        self.listen(hikari.StoppingEvent)(self.on_stopping)
         self.listen(lightbulb.CommandErrorEvent)(self.on_error)
+        self.listen(hikari.GuildAvailableEvent)(self.guild_handler.on_guild_available)
+        self.listen(hikari.MemberUpdateEvent)(self.member_resolver.on_member_update)
+        self.listen(hikari.MemberDeleteEvent)(self.member_resolver.on_member_delete)
+        self.listen(hikari.GuildMessageCreateEvent)(self.message_handler.on_message_create)
         self.listen(hikari.GuildMessageDeleteEvent)(self.message_handler.on_message_delete)
+        self.listen(hikari.GuildBulkMessageDeleteEvent)(self.message_handler.on_message_bulk_delete)
         self.listen(hikari.GuildMessageUpdateEvent)(self.message_handler.on_message_edit)
+        if self.lavalink_config.enabled:
+            self.listen(ongaku.StatisticsEvent)(self.d.ongaku.session_handler.update_statistics)
         logger.info("Event handlers registered")
 
     async def on_started(self, event: hikari.StartedEvent) -> None:
         """Handler for bot startup."""
+        await self.d.api_client.start()
+        self.message_handler.start()
+        self.guild_handler.start()
+        self.guild_handler.prefetch_cached_guilds()
         logger.info("Bot has started successfully!")
 
+    async def on_stopping(self, event: hikari.StoppingEvent) -> None:
+        """Handler for bot shutdown."""
+        await self.message_handler.stop()
+        await self.guild_handler.stop()
+        await self.d.api_client.close()
+        logger.info("Bot is shutting down")
+
     async def on_error(self, event: lightbulb.CommandErrorEvent) -> None:
         """Central error handler that delegates to specific handlers."""
         try:
@@ -0,0 +1,55 @@
+import typing
+from collections import OrderedDict
+
+
+class CachedMessage:
+    """
+    Content-only record of a message, just enough to capture it once deleted or edited.
+
+    The send time is not stored, it is encoded in the message's snowflake ID.
+    """
+
+    __slots__ = ("channel_id", "author_id", "content", "is_bot")
+
+    def __init__(self, channel_id: int, author_id: int, content: typing.Optional[str], is_bot: bool = False) -> None:
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.content = content
+        self.is_bot = is_bot
+
+
+class MessageCache:
+    """
+    Bounded cache of recent messages keyed by message ID.
+
+    Messages arrive in send order, so the oldest message is evicted once
+    ``maxsize`` is reached. This replaces hikari's full message cache, which
+    keeps complete message objects (embeds, attachments, member snapshots)
+    that capture never reads.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._messages: OrderedDict[int, CachedMessage] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def add(
+        self,
+        message_id: int,
+        channel_id: int,
+        author_id: int,
+        content: typing.Optional[str],
+        is_bot: bool = False,
+    ) -> None:
+        self._messages[message_id] = CachedMessage(channel_id, author_id, content, is_bot)
+        while len(self._messages) > self.maxsize:
+            self._messages.popitem(last=False)
+
+    def get(self, message_id: int) -> typing.Optional[CachedMessage]:
+        return self._messages.get(message_id)
+
+    def pop(self, message_id: int) -> typing.Optional[CachedMessage]:
+        """Remove and return a message, as it can no longer be deleted twice."""
+        return self._messages.pop(message_id, None)
@@ -0,0 +1,43 @@
+import asyncio
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class SingleFlight(typing.Generic[K, V]):
+    """
+    Coalesces concurrent calls that share a key into a single in-flight task.
+
+    The first caller for a key starts the work and every caller that arrives
+    while it is still running awaits the same result. Callers are shielded
+    from each other, so one of them being cancelled does not cancel the work
+    the others are waiting on. Calls that joined an in-flight task are
+    counted as coalesced.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: typing.Dict[K, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: K, func: typing.Callable[[], typing.Awaitable[V]]) -> V:
+        """Run ``func`` for ``key`` unless an identical call is already in flight."""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """Call and coalesced counters and the number of tasks in flight."""
+        return {"calls": self.calls, "coalesced": self.coalesced, "inflight": len(self._inflight)}
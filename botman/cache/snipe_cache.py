@@ -0,0 +1,134 @@
+import time
+import typing
+from collections import OrderedDict, deque
+
+
+class DeletedSnipe:
+    """Compact record of a deleted message."""
+
+    __slots__ = ("guild_id", "channel_id", "message_id", "content", "author_id", "created_at")
+
+    def __init__(
+        self,
+        guild_id: str,
+        channel_id: str,
+        message_id: str,
+        content: typing.Optional[str],
+        author_id: typing.Optional[str],
+    ) -> None:
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.content = content
+        self.author_id = author_id
+        self.created_at = time.time()
+
+    def to_dict(self) -> typing.Dict:
+        """Return the record in the same shape as the backend API."""
+        return {
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+            "message_id": self.message_id,
+            "content": self.content,
+            "author_id": self.author_id,
+            # Spooled records are replayed late, the backend keeps this as their creation time
+            "captured_at": self.created_at,
+        }
+
+
+class EditedSnipe:
+    """Compact record of an edited message."""
+
+    __slots__ = ("guild_id", "channel_id", "message_id", "old_content", "new_content", "author_id", "created_at")
+
+    def __init__(
+        self,
+        guild_id: str,
+        channel_id: str,
+        message_id: str,
+        old_content: typing.Optional[str],
+        new_content: typing.Optional[str],
+        author_id: typing.Optional[str],
+    ) -> None:
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.old_content = old_content
+        self.new_content = new_content
+        self.author_id = author_id
+        self.created_at = time.time()
+
+    def to_dict(self) -> typing.Dict:
+        """Return the record in the same shape as the backend API."""
+        return {
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+            "message_id": self.message_id,
+            "old_content": self.old_content,
+            "new_content": self.new_content,
+            "author_id": self.author_id,
+            # Spooled records are replayed late, the backend keeps this as their creation time
+            "captured_at": self.created_at,
+        }
+
+
+class _ChannelRings:
+    """Fixed-capacity ring buffers keyed by channel, bounded by channel count."""
+
+    def __init__(self, capacity: int, max_channels: int) -> None:
+        self._capacity = capacity
+        self._max_channels = max_channels
+        self._rings: OrderedDict[str, deque] = OrderedDict()
+
+    def append(self, channel_id: str, record: typing.Any) -> None:
+        ring = self._rings.get(channel_id)
+        if ring is None:
+            ring = self._rings[channel_id] = deque(maxlen=self._capacity)
+            while len(self._rings) > self._max_channels:
+                self._rings.popitem(last=False)
+        else:
+            self._rings.move_to_end(channel_id)
+        ring.append(record)
+
+    def latest(self, channel_id: str, max_age: typing.Optional[float] = None) -> typing.Optional[typing.Any]:
+        ring = self._rings.get(channel_id)
+        if not ring:
+            return None
+
+        record = ring[-1]
+        if max_age is not None and time.time() - record.created_at > max_age:
+            # The newest record is expired so the whole ring is, free it
+            del self._rings[channel_id]
+            return None
+        return record
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+
+class SnipeCache:
+    """
+    In-memory store of the most recent deleted and edited messages per channel.
+
+    Each channel keeps a ring buffer of at most ``capacity`` records and the
+    least recently active channels are dropped past ``max_channels``, so the
+    footprint stays fixed no matter how busy the bot is.
+    """
+
+    def __init__(self, capacity: int = 10, max_channels: int = 5_000) -> None:
+        self._deleted = _ChannelRings(capacity, max_channels)
+        self._edited = _ChannelRings(capacity, max_channels)
+
+    def add_deleted(self, record: DeletedSnipe) -> None:
+        self._deleted.append(record.channel_id, record)
+
+    def add_edited(self, record: EditedSnipe) -> None:
+        self._edited.append(record.channel_id, record)
+
+    def latest_deleted(self, channel_id: str, max_age: typing.Optional[float] = None) -> typing.Optional[DeletedSnipe]:
+        """Most recent deleted message in ``channel_id`` no older than ``max_age`` seconds, if any is cached."""
+        return self._deleted.latest(channel_id, max_age)
+
+    def latest_edited(self, channel_id: str, max_age: typing.Optional[float] = None) -> typing.Optional[EditedSnipe]:
+        """Most recent edited message in ``channel_id`` no older than ``max_age`` seconds, if any is cached."""
+        return self._edited.latest(channel_id, max_age)
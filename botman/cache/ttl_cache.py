@@ -0,0 +1,89 @@
+import time
+import typing
+from collections import OrderedDict
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class TTLCache(typing.Generic[K, V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Reads move entries to the most recently used end, writes evict the least
+    recently used entry once ``maxsize`` is reached. Expired entries are kept
+    until evicted or overwritten so callers can fall back to a stale value with
+    ``peek``. Hit and miss counters are kept so cache effectiveness can be
+    inspected at runtime.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, typing.Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: K, default: typing.Optional[V] = None) -> typing.Optional[V]:
+        """Return the cached value for ``key`` or ``default`` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            # Expired entries stay until evicted so they can still be served stale via peek()
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: K, default: typing.Optional[V] = None) -> typing.Optional[V]:
+        """Return the value for ``key`` even if it has expired, without touching LRU order or counters."""
+        entry = self._data.get(key)
+        return entry[1] if entry is not None else default
+
+    def set(self, key: K, value: V, ttl: typing.Optional[float] = None) -> None:
+        """
+        Insert or refresh ``key``, evicting the least recently used entry if full.
+
+        ``ttl`` overrides the cache's time-to-live for this entry, ``0`` inserts
+        it already expired so it is only served through ``peek``.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: typing.Optional[V] = None) -> typing.Optional[V]:
+        """Remove ``key`` and return its value regardless of expiry."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def items(self, include_expired: bool = False) -> typing.List[typing.Tuple[K, V]]:
+        """Snapshot of the cached entries, least recently used first."""
+        now = time.monotonic()
+        return [
+            (key, value)
+            for key, (expires_at, value) in self._data.items()
+            if include_expired or expires_at > now
+        ]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
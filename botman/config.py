@@ -1,18 +1,109 @@
 import os
+import typing
 from dataclasses import dataclass
 
+# GLOBALS
+SNIPE_TIMEOUT = int(os.getenv("SNIPE_TIMEOUT", 10))  # minutes
+
 # DATACLASSES
+@dataclass(frozen=True)
+class LavalinkNode:
+    name: str
+    host: str
+    port: int
+    region: typing.Optional[str] = None  # Discord voice region this node is close to
+
 @dataclass
 class LavalinkConfig:
+    enabled: bool = os.getenv("ENABLE_LAVALINK", "false").lower() in ("1", "true", "yes")
     host: str = os.getenv("LAVALINK_SERVER_HOST", "lavalink")
     port: int = int(os.getenv("LAVALINK_SERVER_PORT", 2333))
     password: str = os.getenv("LAVALINK_SERVER_PASSWORD", "youshallnotpass")
+    worker_idle_timeout: float = float(os.getenv("MUSIC_WORKER_IDLE_TIMEOUT", 300))
+    search_cache_size: int = int(os.getenv("MUSIC_SEARCH_CACHE_SIZE", 1_000))
+    search_cache_ttl: float = float(os.getenv("MUSIC_SEARCH_CACHE_TTL", 600))
+    catalog_path: str = os.getenv("MUSIC_CATALOG_PATH", "data/tracks.db")  # empty to disable
+    catalog_max_tracks: int = int(os.getenv("MUSIC_CATALOG_MAX_TRACKS", 1_000_000))
+    queue_window: int = int(os.getenv("MUSIC_QUEUE_WINDOW", 3))  # tracks kept fully loaded at the play head
+    nodes: typing.Tuple[LavalinkNode, ...] = None
+
+    def __post_init__(self):
+        if self.nodes is None:
+            # name=host:port[/region], comma separated, all sharing the server password
+            nodes = []
+            for entry in os.getenv("LAVALINK_NODES", "").split(","):
+                if not entry.strip():
+                    continue
+                name, _, address = entry.strip().partition("=")
+                address, _, region = address.partition("/")
+                host, _, port = address.rpartition(":")
+                nodes.append(LavalinkNode(name, host, int(port), region or None))
+            self.nodes = tuple(nodes) or (LavalinkNode("default-session", self.host, self.port),)
+
+@dataclass
+class APIConfig:
+    storage_backend: str = os.getenv("BOT_STORAGE_BACKEND", "http")  # http or sqlite
+    sqlite_path: str = os.getenv("SQLITE_PATH", "data/botman.db")
+    base_url: str = os.getenv("BOT_API_URL", "http://localhost:8080")
+    pool_size: int = int(os.getenv("BOT_API_POOL_SIZE", 100))
+    pool_size_per_host: int = int(os.getenv("BOT_API_POOL_SIZE_PER_HOST", 30))
+    keepalive_timeout: float = float(os.getenv("BOT_API_KEEPALIVE_TIMEOUT", 30))
+    dns_cache_ttl: int = int(os.getenv("BOT_API_DNS_CACHE_TTL", 300))
+    connect_timeout: float = float(os.getenv("BOT_API_CONNECT_TIMEOUT", 2))
+    request_timeout: float = float(os.getenv("BOT_API_REQUEST_TIMEOUT", 5))
+    wire_format: str = os.getenv("BOT_API_WIRE_FORMAT", "json")  # json or msgpack
+    settings_cache_size: int = int(os.getenv("SETTINGS_CACHE_SIZE", 10_000))
+    settings_cache_ttl: float = float(os.getenv("SETTINGS_CACHE_TTL", 300))
+    breaker_failure_threshold: int = int(os.getenv("BOT_API_BREAKER_THRESHOLD", 5))
+    breaker_reset_timeout: float = float(os.getenv("BOT_API_BREAKER_RESET", 30))
+    prefetch_batch_size: int = int(os.getenv("PREFETCH_BATCH_SIZE", 1000))
+    prefetch_delay: float = float(os.getenv("PREFETCH_DELAY", 1))
+    settings_snapshot_path: str = os.getenv("SETTINGS_SNAPSHOT_PATH", "data/guild_settings.json")
+    settings_snapshot_interval: float = float(os.getenv("SETTINGS_SNAPSHOT_INTERVAL", 300))
+
+@dataclass
+class CaptureConfig:
+    batch_size: int = int(os.getenv("CAPTURE_BATCH_SIZE", 100))
+    flush_interval: float = float(os.getenv("CAPTURE_FLUSH_INTERVAL", 2))
+    max_pending: int = int(os.getenv("CAPTURE_MAX_PENDING", 10_000))
+    snipe_cache_size: int = int(os.getenv("SNIPE_CACHE_SIZE", 10))
+    snipe_cache_channels: int = int(os.getenv("SNIPE_CACHE_CHANNELS", 5_000))
+    message_cache_size: int = int(os.getenv("MESSAGE_CACHE_SIZE", 100_000))
+    max_edit_length: int = int(os.getenv("CAPTURE_MAX_EDIT_LENGTH", 4_000))  # old + new content
+    ignored_channels: frozenset[int] = None
+
+    def __post_init__(self):
+        if self.ignored_channels is None:
+            channels = os.getenv("CAPTURE_IGNORED_CHANNELS", "")
+            self.ignored_channels = frozenset(int(channel) for channel in channels.split(",") if channel.strip())
+
+@dataclass
+class RetentionConfig:
+    snipe_timeout: float = SNIPE_TIMEOUT * 60  # seconds
+    # Twice the snipe window by default, so pruning never races records that are still snipeable
+    max_age: float = float(os.getenv("RETENTION_MAX_AGE", SNIPE_TIMEOUT * 60 * 2))  # seconds
+    per_guild_cap: int = int(os.getenv("RETENTION_PER_GUILD_CAP", 100))
+    prune_interval: float = float(os.getenv("RETENTION_PRUNE_INTERVAL", 60))
+    prune_batch_size: int = int(os.getenv("RETENTION_PRUNE_BATCH_SIZE", 5_000))
+
+@dataclass
+class SpoolConfig:
+    directory: str = os.getenv("SPOOL_DIR", "data/spool")
+    segment_bytes: int = int(os.getenv("SPOOL_SEGMENT_BYTES", 4_194_304))  # 4MB
+    max_bytes: int = int(os.getenv("SPOOL_MAX_BYTES", 268_435_456))  # 256MB
+    fsync_interval: float = float(os.getenv("SPOOL_FSYNC_INTERVAL", 1))
+    replay_interval: float = float(os.getenv("SPOOL_REPLAY_INTERVAL", 10))
+    replay_batch_size: int = int(os.getenv("SPOOL_REPLAY_BATCH_SIZE", 500))
 
 @dataclass
 class BotConfig:
     token: str = os.getenv("DISCORD_BOT_TOKEN", "")
     prefix: str = "!"
     owner_ids: list[int] = None
+    extra_intents: int = int(os.getenv("BOT_EXTRA_INTENTS", 0))  # bitmask added to the plugins' intents
+    on_demand_members: bool = os.getenv("ON_DEMAND_MEMBERS", "false").lower() in ("1", "true", "yes")
+    member_cache_size: int = int(os.getenv("MEMBER_CACHE_SIZE", 5_000))
+    member_cache_ttl: float = float(os.getenv("MEMBER_CACHE_TTL", 600))
     
     def __post_init__(self):
         if self.owner_ids is None:
@@ -82,6 +173,3 @@ class LogConfig:
         """
         self.file_path = new_path
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-
-# GLOBALS
-SNIPE_TIMEOUT = 10
\ No newline at end of file
@@ -0,0 +1,44 @@
+import typing
+
+from cache.message_cache import CachedMessage
+
+# Outcomes counted by EditFilter, in the order the checks run
+IGNORED_CHANNEL = "ignored_channel"
+BOT_AUTHOR = "bot_author"
+UNCHANGED = "unchanged"
+OVERSIZE = "oversize"
+ACCEPTED = "accepted"
+
+
+class EditFilter:
+    """
+    Cheap checks run on every edit event before anything is built or queued for storage.
+
+    Edits in ignored channels, edits by bots, updates whose content did not
+    change (link embeds unfurling, pins, resumed duplicates) and edits whose
+    old and new content together exceed ``max_content_length`` are dropped.
+    Every outcome is counted so the filter's effect can be inspected.
+    """
+
+    def __init__(self, ignored_channels: typing.AbstractSet[int] = frozenset(), max_content_length: int = 4_000) -> None:
+        self.ignored_channels = ignored_channels
+        self.max_content_length = max_content_length
+        self.counters: typing.Dict[str, int] = dict.fromkeys(
+            (IGNORED_CHANNEL, BOT_AUTHOR, UNCHANGED, OVERSIZE, ACCEPTED), 0
+        )
+
+    def accepts(self, message: CachedMessage, new_content: typing.Optional[str]) -> bool:
+        """Whether the edit of ``message`` to ``new_content`` should be captured."""
+        if message.channel_id in self.ignored_channels:
+            outcome = IGNORED_CHANNEL
+        elif message.is_bot:
+            outcome = BOT_AUTHOR
+        elif new_content == message.content:
+            outcome = UNCHANGED
+        elif len(message.content or "") + len(new_content or "") > self.max_content_length:
+            outcome = OVERSIZE
+        else:
+            outcome = ACCEPTED
+
+        self.counters[outcome] += 1
+        return outcome == ACCEPTED
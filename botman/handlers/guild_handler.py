@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import typing
+import hikari
+
+from api.settings_snapshot import SettingsSnapshot
+from config import APIConfig
+
+logger = logging.getLogger(__name__)
+
+class GuildHandler:
+    """Handles guild lifecycle events and warms per-guild caches in bulk."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.api_config = APIConfig()
+        self._pending: typing.Set[str] = set()
+        self._prefetch_task: typing.Optional[asyncio.Task] = None
+        self.snapshot = SettingsSnapshot(self.api_config.settings_snapshot_path)
+        self._snapshot_task: typing.Optional[asyncio.Task] = None
+
+    def load_snapshot(self) -> None:
+        """
+        Seed the settings cache from the last snapshot as a stale fallback.
+
+        Entries are inserted already expired: lookups still go to the backend
+        and the prefetch revalidates them, but if the backend is unavailable
+        the snapshot is served instead of the defaults.
+        """
+        settings = self.snapshot.load()
+        settings_cache = self.bot.d.api_client.settings_cache
+        for entry in settings:
+            settings_cache.set(entry.guild_id, entry, ttl=0)
+        logger.info(f"Loaded {len(settings)} guild settings from snapshot")
+
+    def start(self) -> None:
+        """Start periodically snapshotting the settings cache."""
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self) -> None:
+        """Stop the snapshot loop and write a final snapshot."""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        await self.save_snapshot()
+
+    async def save_snapshot(self) -> None:
+        settings = [entry for _, entry in self.bot.d.api_client.settings_cache.items(include_expired=True)]
+        try:
+            written = await asyncio.to_thread(self.snapshot.save, settings)
+            logger.debug(f"Saved {written} guild settings to snapshot")
+        except OSError as e:
+            logger.error(f"Failed to save guild settings snapshot: {e}")
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.api_config.settings_snapshot_interval)
+            await self.save_snapshot()
+
+    async def on_guild_available(self, event: hikari.GuildAvailableEvent) -> None:
+        """Queue a guild for prefetch when it becomes available, including after reconnects."""
+        self.schedule_prefetch([str(event.guild_id)])
+
+    def prefetch_cached_guilds(self) -> None:
+        """Queue every guild in the gateway cache for prefetch, including guilds with cached settings."""
+        self.schedule_prefetch([str(guild_id) for guild_id in self.bot.cache.get_guilds_view()], force=True)
+
+    def schedule_prefetch(self, guild_ids: typing.Iterable[str], force: bool = False) -> None:
+        """
+        Queue guilds for a bulk settings prefetch.
+
+        Guilds arriving within ``prefetch_delay`` of each other are collected
+        and fetched together in batches of ``prefetch_batch_size``. Guilds
+        with fresh cached settings are skipped unless ``force`` is set.
+        """
+        settings_cache = self.bot.d.api_client.settings_cache
+        self._pending.update(guild_id for guild_id in guild_ids if force or guild_id not in settings_cache)
+
+        if self._pending and (self._prefetch_task is None or self._prefetch_task.done()):
+            self._prefetch_task = asyncio.create_task(self._prefetch())
+
+    async def _prefetch(self) -> None:
+        await asyncio.sleep(self.api_config.prefetch_delay)
+
+        while self._pending:
+            batch = [self._pending.pop() for _ in range(min(len(self._pending), self.api_config.prefetch_batch_size))]
+            try:
+                warmed = await self.bot.d.api_client.prefetch_guild_settings(batch)
+            except Exception as e:
+                logger.error(f"Failed to prefetch settings for {len(batch)} guilds: {e}")
+                continue
+
+            if not warmed:
+                logger.warning(f"Skipped prefetch for {len(batch) + len(self._pending)} guilds, backend unavailable")
+                self._pending.clear()
+                return
+            logger.info(f"Prefetched settings for {warmed} guilds")
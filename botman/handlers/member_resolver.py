@@ -0,0 +1,63 @@
+import logging
+import typing
+import hikari
+
+from cache.single_flight import SingleFlight
+from cache.ttl_cache import TTLCache
+from config import BotConfig
+
+logger = logging.getLogger(__name__)
+
+MemberKey = typing.Tuple[int, int]
+
+
+class MemberResolver:
+    """
+    Resolves guild members on demand instead of relying on a fully chunked member cache.
+
+    Lookups try hikari's cache first, then a small LRU of recently resolved
+    members, and finally fetch the member over REST. Concurrent lookups of
+    the same member share one request. Member update and leave events evict
+    the LRU entry so roles and nicknames do not go stale.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.config = BotConfig()
+        self._members: TTLCache[MemberKey, hikari.Member] = TTLCache(
+            maxsize=self.config.member_cache_size,
+            ttl=self.config.member_cache_ttl,
+        )
+        self._inflight: SingleFlight[MemberKey, typing.Optional[hikari.Member]] = SingleFlight()
+
+    async def resolve(self, guild_id: hikari.Snowflakeish, user_id: hikari.Snowflakeish) -> typing.Optional[hikari.Member]:
+        """Return the member for ``user_id`` in ``guild_id``, or None if they are not in the guild."""
+        member = self.bot.cache.get_member(guild_id, user_id)
+        if member is not None:
+            return member
+
+        key = (int(guild_id), int(user_id))
+        member = self._members.get(key)
+        if member is not None:
+            return member
+
+        return await self._inflight.do(key, lambda: self._fetch(key))
+
+    async def _fetch(self, key: MemberKey) -> typing.Optional[hikari.Member]:
+        guild_id, user_id = key
+        try:
+            member = await self.bot.rest.fetch_member(guild_id, user_id)
+        except hikari.NotFoundError:
+            return None
+        except hikari.HTTPError as e:
+            logger.error(f"Failed to fetch member {user_id} in guild {guild_id}: {e}")
+            return None
+
+        self._members.set(key, member)
+        return member
+
+    async def on_member_update(self, event: hikari.MemberUpdateEvent) -> None:
+        self._members.pop((int(event.guild_id), int(event.user_id)))
+
+    async def on_member_delete(self, event: hikari.MemberDeleteEvent) -> None:
+        self._members.pop((int(event.guild_id), int(event.user_id)))
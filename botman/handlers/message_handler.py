@@ -1,42 +1,175 @@
+import asyncio
 import datetime
 import logging
+import typing
 import hikari
 
+from api.batch_writer import BatchWriter
+from api.spool import MessageSpool
+from cache.message_cache import CachedMessage, MessageCache
+from handlers.edit_filter import EditFilter
+from cache.snipe_cache import DeletedSnipe, EditedSnipe, SnipeCache
+from config import CaptureConfig, RetentionConfig, SpoolConfig
+
 logger = logging.getLogger(__name__)
 
 class MessageHandler:
     """Handles message-related events."""
-    
+
     def __init__(self, bot):
         self.bot = bot
+        self.capture_config = CaptureConfig()
+        self.spool_config = SpoolConfig()
+        self.retention_config = RetentionConfig()
+        self._prune_task: typing.Optional[asyncio.Task] = None
+        self.spool = MessageSpool(
+            self.spool_config.directory,
+            segment_bytes=self.spool_config.segment_bytes,
+            max_bytes=self.spool_config.max_bytes,
+            fsync_interval=self.spool_config.fsync_interval,
+        )
+        self.message_cache = MessageCache(self.capture_config.message_cache_size)
+        self.edit_filter = EditFilter(
+            ignored_channels=self.capture_config.ignored_channels,
+            max_content_length=self.capture_config.max_edit_length,
+        )
+        self.snipe_cache = SnipeCache(
+            capacity=self.capture_config.snipe_cache_size,
+            max_channels=self.capture_config.snipe_cache_channels,
+        )
+        self.deleted_writer = BatchWriter(
+            "deleted message",
+            self._flush_deleted,
+            max_batch_size=self.capture_config.batch_size,
+            flush_interval=self.capture_config.flush_interval,
+            max_pending=self.capture_config.max_pending,
+            fallback=self._spool_deleted,
+        )
+        self.edited_writer = BatchWriter(
+            "edited message",
+            self._flush_edited,
+            max_batch_size=self.capture_config.batch_size,
+            flush_interval=self.capture_config.flush_interval,
+            max_pending=self.capture_config.max_pending,
+            fallback=self._spool_edited,
+        )
+
+    def start(self) -> None:
+        """Start the write-behind capture pipeline, the spool replayer and the retention job."""
+        self.deleted_writer.start()
+        self.edited_writer.start()
+        self.spool.start_replayer(
+            {"deleted": self._flush_deleted, "edited": self._flush_edited},
+            self.bot.d.api_client.health_check,
+            interval=self.spool_config.replay_interval,
+            batch_size=self.spool_config.replay_batch_size,
+        )
+        if self._prune_task is None or self._prune_task.done():
+            self._prune_task = asyncio.create_task(self._prune_loop())
+
+    async def stop(self) -> None:
+        """Flush pending captures to the backend, or the spool, and stop the pipeline."""
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+            try:
+                await self._prune_task
+            except asyncio.CancelledError:
+                pass
+            self._prune_task = None
+
+        await self.deleted_writer.stop()
+        await self.edited_writer.stop()
+        await self.spool.stop_replayer()
+
+    async def _prune_loop(self) -> None:
+        """Periodically delete captured messages past their retention so storage stays bounded."""
+        config = self.retention_config
+        while True:
+            await asyncio.sleep(config.prune_interval)
+            deleted = await self.bot.d.api_client.prune_messages(
+                config.max_age,
+                config.per_guild_cap,
+                config.prune_batch_size,
+            )
+            if deleted:
+                logger.info(f"Pruned {deleted} expired captured messages")
+
+    async def _flush_deleted(self, batch: typing.List[typing.Dict]) -> bool:
+        return await self.bot.d.api_client.store_deleted_messages(batch)
+
+    async def _flush_edited(self, batch: typing.List[typing.Dict]) -> bool:
+        return await self.bot.d.api_client.store_edited_messages(batch)
+
+    async def _spool_deleted(self, batch: typing.List[typing.Dict]) -> None:
+        await self.spool.append("deleted", batch)
+
+    async def _spool_edited(self, batch: typing.List[typing.Dict]) -> None:
+        await self.spool.append("edited", batch)
+
+    @staticmethod
+    def _deleted_record(
+        guild_id: hikari.Snowflake,
+        message_id: hikari.Snowflake,
+        message: CachedMessage,
+    ) -> DeletedSnipe:
+        return DeletedSnipe(
+            guild_id=str(guild_id),
+            channel_id=str(message.channel_id),
+            message_id=str(message_id),
+            content=message.content,
+            author_id=str(message.author_id)
+        )
+
+    async def on_message_create(self, event: hikari.GuildMessageCreateEvent) -> None:
+        """Remember the content of new messages so they can be captured if deleted or edited."""
+        self.message_cache.add(event.message_id, event.channel_id, event.author_id, event.content, event.is_bot)
 
     async def on_message_delete(self, event: hikari.GuildMessageDeleteEvent) -> None:
         """Handle message delete events."""
-        if not event.old_message:
+        message = self.message_cache.pop(event.message_id)
+        if not message:
+            return
+
+        record = self._deleted_record(event.guild_id, event.message_id, message)
+        self.snipe_cache.add_deleted(record)
+        await self.deleted_writer.put(record.to_dict())
+
+    async def on_message_bulk_delete(self, event: hikari.GuildBulkMessageDeleteEvent) -> None:
+        """Handle bulk message delete events by capturing every cached message at once."""
+        records = []
+        for message_id in event.message_ids:
+            message = self.message_cache.pop(message_id)
+            if message:
+                records.append(self._deleted_record(event.guild_id, message_id, message))
+        if not records:
             return
-            
-        message_data = {
-            "guild_id": str(event.guild_id),
-            "channel_id": str(event.channel_id),
-            "message_id": str(event.message_id),
-            "content": event.old_message.content,
-            "author_id": str(event.old_message.author.id) if event.old_message.author else None
-        }
-        
-        await self.bot.d.api_client.store_deleted_message(message_data)
+
+        logger.debug(f"Capturing {len(records)}/{len(event.message_ids)} bulk deleted messages in {event.channel_id}")
+        for record in records:
+            self.snipe_cache.add_deleted(record)
+        await self.deleted_writer.put_many(record.to_dict() for record in records)
 
     async def on_message_edit(self, event: hikari.GuildMessageUpdateEvent) -> None:
         """Handle message edit events."""
-        if not event.old_message or not event.message:
+        message = self.message_cache.get(event.message_id)
+        new_content = event.message.content
+        # Updates that do not carry content (e.g. embeds resolving) are not edits
+        if not message or new_content is hikari.UNDEFINED:
+            return
+
+        if not self.edit_filter.accepts(message, new_content):
+            message.content = new_content
             return
-            
-        message_data = {
-            "guild_id": str(event.guild_id),
-            "channel_id": str(event.channel_id),
-            "message_id": str(event.message_id),
-            "old_content": event.old_message.content,
-            "new_content": event.message.content,
-            "author_id": str(event.author_id) if event.author_id else None
-        }
-        
-        await self.bot.d.api_client.store_edited_message(message_data)
\ No newline at end of file
+
+        record = EditedSnipe(
+            guild_id=str(event.guild_id),
+            channel_id=str(message.channel_id),
+            message_id=str(event.message_id),
+            old_content=message.content,
+            new_content=new_content,
+            author_id=str(message.author_id)
+        )
+        message.content = new_content
+
+        self.snipe_cache.add_edited(record)
+        await self.edited_writer.put(record.to_dict())
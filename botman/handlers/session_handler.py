@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import typing
 import random
 from datetime import datetime, timedelta
 
 import hikari
+import ongaku
 
+from config import LavalinkConfig
 from ongaku import errors
 from ongaku.abc import handler as handler_
 from ongaku.abc import session as session_
@@ -17,6 +20,40 @@ if typing.TYPE_CHECKING:
     from ongaku.player import Player
     from ongaku.session import Session
 
+# Discord voice region of the player about to be created, set around ``Client.create_player``
+region_hint: contextvars.ContextVar[typing.Optional[str]] = contextvars.ContextVar("region_hint", default=None)
+
+
+class NodeStats:
+    """Load figures from a Lavalink node's last stats op."""
+
+    __slots__ = ("players", "playing_players", "system_load", "frames_deficit", "frames_nulled")
+
+    def __init__(
+        self,
+        players: int,
+        playing_players: int,
+        system_load: float,
+        frames_deficit: int = 0,
+        frames_nulled: int = 0,
+    ) -> None:
+        self.players = players
+        self.playing_players = playing_players
+        self.system_load = system_load
+        self.frames_deficit = frames_deficit
+        self.frames_nulled = frames_nulled
+
+    def penalty(self) -> float:
+        """
+        Lavalink's usual load penalty: playing players, plus CPU load and
+        per-minute frame deficits, both weighted to grow exponentially.
+        """
+        cpu = 1.05 ** (100 * self.system_load) * 10 - 10
+        deficit = 1.03 ** (500 * self.frames_deficit / 3000) * 600 - 600
+        nulled = (1.03 ** (500 * self.frames_nulled / 3000) * 300 - 300) * 2
+        return self.playing_players + cpu + deficit + nulled
+
+
 class RetrySessionHandler(handler_.SessionHandler):
     """
     Session Handler with retry capabilities.
@@ -24,13 +61,19 @@ class RetrySessionHandler(handler_.SessionHandler):
     This handler extends the basic functionality by adding retry mechanisms when sessions
     fail or become unavailable. It implements exponential backoff with jitter for retries
     and keeps track of session health.
+
+    New players are placed on the connected session with the lowest load
+    penalty, computed from each node's latest stats and the players placed
+    on it since. Sessions in the region of ``region_hint`` are preferred.
     """
 
     __slots__: typing.Sequence[str] = (
         "_client",
         "_is_alive",
-        "_current_session",
         "_sessions",
+        "_regions",
+        "_stats",
+        "_assigned",
         "_players",
         "_retry_attempts",
         "_last_retry",
@@ -46,8 +89,11 @@ class RetrySessionHandler(handler_.SessionHandler):
     ) -> None:
         self._client = client
         self._is_alive = False
-        self._current_session: Session | None = None
         self._sessions: typing.MutableMapping[str, Session] = {}
+        self._regions = {node.name: node.region for node in LavalinkConfig().nodes if node.region}
+        self._stats: typing.MutableMapping[str, NodeStats] = {}
+        # Players placed on each session since its last stats op, which only arrives once a minute
+        self._assigned: typing.MutableMapping[str, int] = {}
         self._players: typing.MutableMapping[hikari.Snowflake, Player] = {}
         
         # Retry-specific attributes
@@ -71,6 +117,24 @@ class RetrySessionHandler(handler_.SessionHandler):
         """Whether the handler is alive or not."""
         return self._is_alive
 
+    def penalty(self, session: Session) -> float:
+        """Load penalty of ``session``, lower is better."""
+        stats = self._stats.get(session.name)
+        penalty = stats.penalty() if stats is not None else 0.0
+        return penalty + self._assigned.get(session.name, 0)
+
+    async def update_statistics(self, event: ongaku.StatisticsEvent) -> None:
+        """Record a node's stats op."""
+        frames = event.frame_statistics
+        self._stats[event.session.name] = NodeStats(
+            event.players,
+            event.playing_players,
+            event.cpu.system_load,
+            frames.deficit if frames is not None else 0,
+            frames.nulled if frames is not None else 0,
+        )
+        self._assigned[event.session.name] = 0
+
     async def _attempt_reconnect(self, session: Session) -> bool:
         """
         Attempts to reconnect a session using exponential backoff with jitter.
@@ -144,6 +208,8 @@ class RetrySessionHandler(handler_.SessionHandler):
             await session.stop()
 
         self._players.clear()
+        self._stats.clear()
+        self._assigned.clear()
         self._retry_attempts.clear()
         self._last_retry.clear()
         self._is_alive = False
@@ -161,7 +227,7 @@ class RetrySessionHandler(handler_.SessionHandler):
 
     def fetch_session(self, name: str | None = None) -> Session:
         """
-        Fetch a session, attempting to retry if it's disconnected.
+        Fetch a session by name, or the least loaded connected one, attempting to retry if it's disconnected.
         """
         if name is not None:
             try:
@@ -172,14 +238,12 @@ class RetrySessionHandler(handler_.SessionHandler):
             except KeyError:
                 raise errors.SessionMissingError
 
-        if self._current_session and self._current_session.status == session_.SessionStatus.CONNECTED:
-            return self._current_session
-
-        # Try to find a connected session
-        for session in self.sessions:
-            if session.status == session_.SessionStatus.CONNECTED:
-                self._current_session = session
-                return session
+        connected = [session for session in self.sessions if session.status == session_.SessionStatus.CONNECTED]
+        if connected:
+            region = region_hint.get()
+            if region is not None:
+                connected = [session for session in connected if self._regions.get(session.name) == region] or connected
+            return min(connected, key=self.penalty)
 
         # If no connected sessions found, try to retry the first available session
         if self.sessions:
@@ -194,6 +258,8 @@ class RetrySessionHandler(handler_.SessionHandler):
             session = self._sessions.pop(name)
             self._retry_attempts.pop(name, None)
             self._last_retry.pop(name, None)
+            self._stats.pop(name, None)
+            self._assigned.pop(name, None)
         except KeyError:
             raise errors.SessionMissingError
 
@@ -206,6 +272,7 @@ class RetrySessionHandler(handler_.SessionHandler):
             )
 
         self._players.update({player.guild_id: player})
+        self._assigned[player.session.name] = self._assigned.get(player.session.name, 0) + 1
         return player
 
     def fetch_player(self, guild: hikari.SnowflakeishOr[hikari.Guild]) -> Player:
@@ -222,4 +289,7 @@ class RetrySessionHandler(handler_.SessionHandler):
         except KeyError:
             raise errors.PlayerMissingError
 
+        assigned = self._assigned.get(player.session.name, 0)
+        if assigned:
+            self._assigned[player.session.name] = assigned - 1
         await player.disconnect()
\ No newline at end of file
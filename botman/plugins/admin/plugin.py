@@ -1,3 +1,4 @@
+import hikari
 import lightbulb
 
 from base.plugin import BasePlugin
@@ -8,6 +9,10 @@ from .commands._mute import MuteCommand
 
 
 class AdminPlugin(BasePlugin):
+    # has_guild_permissions reads the invoker's roles from the cache
+    intents = hikari.Intents.GUILD_MEMBERS
+    cache_components = hikari.api.CacheComponents.MEMBERS | hikari.api.CacheComponents.ROLES
+
     @property
     def plugin_name(self) -> str:
         return "admin"
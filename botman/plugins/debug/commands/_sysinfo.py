@@ -61,5 +61,18 @@ class SysInfoCommand(BaseCommand):
                   f"Free: {disk.free // (1024**3)}GB```",
             inline=True
         )
+
+        track_search = ctx.bot.d.get("track_search")
+        if track_search is not None:
+            stats = track_search.stats
+            embed.add_field(
+                name="Music Search",
+                value=f"```\nSearches: {stats['searches']}\n"
+                      f"Cache hits: {stats['cache_hits']}\n"
+                      f"Coalesced: {stats['coalesced']}\n"
+                      f"Catalog hits: {stats['catalog_hits']}\n"
+                      f"Lavalink: {stats['lavalink_loads']}```",
+                inline=True
+            )
         
         await ctx.respond(embed=embed)
\ No newline at end of file
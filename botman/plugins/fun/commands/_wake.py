@@ -16,7 +16,7 @@ class WakeCommand(BaseCommand):
         @self.plugin.command
         @lightbulb.set_help(self.help_text)
         @lightbulb.option("times", "Number of moves (default: 5, max: 10)", type=int, required=False, default=5)
-        @lightbulb.option("user", "The user to wake up", type=hikari.Member, required=True)
+        @lightbulb.option("user", "The user to wake up", type=hikari.User, required=True)
         @lightbulb.command(self.name, self.description)
         @lightbulb.implements(lightbulb.SlashCommand, lightbulb.PrefixCommand)
         async def cmd(ctx: lightbulb.Context) -> None:
@@ -24,14 +24,14 @@ class WakeCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        target_user = ctx.options.user
-        target_user_voicestate = ctx.bot.cache.get_voice_state(ctx.guild_id, target_user.id)
+        target_user = await ctx.bot.member_resolver.resolve(ctx.guild_id, ctx.options.user.id)
+        target_user_voicestate = ctx.bot.cache.get_voice_state(ctx.guild_id, ctx.options.user.id)
         times = min(max(1, ctx.options.times), 10)
         
-        if not target_user_voicestate:
+        if not target_user or not target_user_voicestate:
             embed = hikari.Embed(
                 title="Error",
-                description=f"{target_user.mention} is not in a voice channel!",
+                description=f"{ctx.options.user.mention} is not in a voice channel!",
                 color=hikari.Color(0xff0000)
             )
             await ctx.respond(embed=embed)
@@ -1,3 +1,4 @@
+import hikari
 import lightbulb
 
 from base.plugin import BasePlugin
@@ -8,6 +9,10 @@ from .commands._rps import RPSCommand
 from .commands._wake import WakeCommand
 
 class FunPlugin(BasePlugin):
+    intents = hikari.Intents.GUILD_VOICE_STATES
+    # Wake checks the target's channel permissions, which come from cached roles
+    cache_components = hikari.api.CacheComponents.VOICE_STATES | hikari.api.CacheComponents.ROLES
+
     @property
     def plugin_name(self) -> str:
         return "fun"
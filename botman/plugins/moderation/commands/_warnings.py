@@ -1,3 +1,6 @@
+import asyncio
+import typing
+
 import hikari
 import lightbulb
 
@@ -42,9 +45,13 @@ class WarningsCommand(BaseCommand):
             color=hikari.Color(0xff9900)
         )
         
+        mod_ids = list(dict.fromkeys(warning['mod'] for warning in warnings))
+        mod_names = dict(zip(mod_ids, await asyncio.gather(
+            *(self._moderator_name(ctx, mod_id) for mod_id in mod_ids)
+        )))
+
         for idx, warning in enumerate(warnings, 1):
-            mod = ctx.bot.cache.get_user(warning['mod'])
-            mod_name = mod.username if mod else "Unknown Moderator"
+            mod_name = mod_names[warning['mod']] or "Unknown Moderator"
             time_str = warning['time'].strftime("%Y-%m-%d %H:%M:%S")
             
             embed.add_field(
@@ -55,4 +62,16 @@ class WarningsCommand(BaseCommand):
                 inline=False
             )
         
-        await ctx.respond(embed=embed)
\ No newline at end of file
+        await ctx.respond(embed=embed)
+
+    async def _moderator_name(self, ctx: lightbulb.Context, mod_id: hikari.Snowflake) -> typing.Optional[str]:
+        """The moderator's username, looked up as a user when they have since left the guild."""
+        mod = await ctx.bot.member_resolver.resolve(ctx.guild_id, mod_id)
+        if mod is None:
+            mod = ctx.bot.cache.get_user(mod_id)
+        if mod is None:
+            try:
+                mod = await ctx.bot.rest.fetch_user(mod_id)
+            except hikari.HTTPError:
+                return None
+        return mod.username
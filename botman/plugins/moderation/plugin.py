@@ -1,3 +1,4 @@
+import hikari
 import lightbulb
 
 from base.plugin import BasePlugin
@@ -8,6 +9,9 @@ from .commands._clearwarnings import ClearWarningsCommand
 
 
 class ModerationPlugin(BasePlugin):
+    intents = hikari.Intents.GUILD_MEMBERS
+    cache_components = hikari.api.CacheComponents.MEMBERS | hikari.api.CacheComponents.ROLES
+
     @property
     def plugin_name(self) -> str:
         return "moderation"
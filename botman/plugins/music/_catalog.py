@@ -0,0 +1,313 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+import typing
+
+import ongaku
+
+if typing.TYPE_CHECKING:
+    import aiosqlite
+
+    from ._search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the schema changes, the catalog is a cache so older tables are simply dropped
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+    id INTEGER PRIMARY KEY,
+    encoded TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    uri TEXT,
+    info TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tracks_last_used ON tracks (last_used);
+
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    playlist_info TEXT,
+    track_ids TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queries_last_used ON queries (last_used);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
+    title, author, content='tracks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS tracks_fts_insert AFTER INSERT ON tracks BEGIN
+    INSERT INTO tracks_fts (rowid, title, author) VALUES (new.id, new.title, new.author);
+END;
+CREATE TRIGGER IF NOT EXISTS tracks_fts_delete AFTER DELETE ON tracks BEGIN
+    INSERT INTO tracks_fts (tracks_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+END;
+"""
+_DROP_OLD_SCHEMA = """
+DROP TABLE IF EXISTS queries;
+DROP TABLE IF EXISTS tracks_fts;
+DROP TABLE IF EXISTS tracks;
+"""
+
+# Shape of the Lavalink result a query resolved to, rebuilt the same way on a catalog hit
+TRACK = "track"
+PLAYLIST = "playlist"
+SEARCH = "search"
+
+_UPSERT_TRACK = (
+    "INSERT INTO tracks (encoded, title, author, length, uri, info, last_used) VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (encoded) DO UPDATE SET last_used = excluded.last_used RETURNING id"
+)
+_UPSERT_QUERY = (
+    "INSERT INTO queries (query, kind, playlist_info, track_ids, last_used) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (query) DO UPDATE SET kind = excluded.kind, playlist_info = excluded.playlist_info, "
+    "track_ids = excluded.track_ids, last_used = excluded.last_used"
+)
+_SELECT_QUERY = "SELECT kind, playlist_info, track_ids FROM queries WHERE query = ?"
+_TOUCH_QUERY = "UPDATE queries SET last_used = ? WHERE query = ?"
+_SEARCH = (
+    "SELECT tracks.title, tracks.author, tracks.uri FROM tracks_fts "
+    "JOIN tracks ON tracks.id = tracks_fts.rowid "
+    "WHERE tracks_fts MATCH ? AND tracks.uri IS NOT NULL ORDER BY rank LIMIT ?"
+)
+_EVICT = "DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} ORDER BY last_used LIMIT ?)"
+
+# Row counts are only checked every this many recorded tracks, counting millions of rows is not free
+_EVICTION_CHECK_INTERVAL = 1_000
+
+
+def _track_payload(track: ongaku.Track) -> typing.Dict[str, typing.Any]:
+    """Lavalink's JSON representation of ``track``, as accepted by the entity builder."""
+    info = track.info
+    return {
+        "encoded": track.encoded,
+        "info": {
+            "identifier": info.identifier,
+            "isSeekable": info.is_seekable,
+            "author": info.author,
+            "length": info.length,
+            "isStream": info.is_stream,
+            "position": info.position,
+            "title": info.title,
+            "uri": info.uri,
+            "artworkUrl": info.artwork_url,
+            "isrc": info.isrc,
+            "sourceName": info.source_name,
+        },
+        "pluginInfo": {},
+        "userData": {},
+    }
+
+
+def _match_expression(text: str) -> str:
+    """FTS5 prefix query matching every word of ``text``, with user input quoted so it is never parsed as syntax."""
+    terms = []
+    for word in text.split():
+        escaped = word.replace('"', '""')
+        terms.append(f'"{escaped}"*')
+    return " ".join(terms)
+
+
+class TrackCatalog:
+    """
+    Persistent catalog of every track Lavalink resolved, backed by SQLite with FTS5.
+
+    Queries are mapped to the tracks they resolved to, and to the shape of
+    the result (single track, playlist or search results), so a repeat
+    ``/play`` is answered locally exactly as Lavalink would have. Titles and
+    authors are full-text indexed for autocomplete. Both tables are bounded
+    by ``max_tracks`` and evict their least recently used rows.
+    """
+
+    def __init__(self, client: ongaku.Client, path: str, max_tracks: int = 1_000_000) -> None:
+        self.client = client
+        self.path = path
+        self.max_tracks = max_tracks
+        self._db: typing.Optional["aiosqlite.Connection"] = None
+        # Resolving and recording span several statements that must not interleave
+        self._lock = asyncio.Lock()
+        self._recorded = 0
+
+    async def start(self) -> None:
+        """Open the database and create the schema if needed."""
+        if self._db is not None:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Imported here so the plugin loads without aiosqlite when the catalog is disabled
+        import aiosqlite
+
+        self._db = await aiosqlite.connect(self.path, cached_statements=64)
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        async with self._db.execute("PRAGMA user_version") as cursor:
+            (version,) = await cursor.fetchone()
+        if version != _SCHEMA_VERSION:
+            await self._db.executescript(_DROP_OLD_SCHEMA)
+            await self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        await self._db.executescript(_SCHEMA)
+        await self._db.commit()
+        logger.info(f"Track catalog opened at {self.path}")
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._db is None:
+            return
+
+        await self._db.close()
+        self._db = None
+
+    async def _get_db(self) -> "aiosqlite.Connection":
+        """Return the open connection, opening it on first use."""
+        if self._db is None:
+            await self.start()
+        return self._db
+
+    # Resolving
+
+    async def resolve(self, query: str) -> typing.Optional["SearchResult"]:
+        """What ``query`` resolved to before, in the same shape, or None if it is unknown or any track was evicted."""
+        try:
+            async with self._lock:
+                found = await self._resolve_locked(query)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to resolve {query!r} from the track catalog: {e}")
+            return None
+
+        if found is None:
+            return None
+
+        kind, playlist_info, payloads = found
+        builder = self.client.entity_builder
+        if kind == TRACK:
+            return builder.build_track(payloads[0])
+        if kind == PLAYLIST:
+            return builder.build_playlist({"info": playlist_info, "pluginInfo": {}, "tracks": payloads})
+        return [builder.build_track(payload) for payload in payloads]
+
+    async def _resolve_locked(
+        self,
+        query: str,
+    ) -> typing.Optional[typing.Tuple[str, typing.Optional[typing.Dict], typing.List[typing.Dict]]]:
+        db = await self._get_db()
+        async with db.execute(_SELECT_QUERY, (query,)) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+
+        kind, playlist_info, track_ids = row[0], row[1], json.loads(row[2])
+        placeholders = ",".join("?" * len(track_ids))
+        async with db.execute(f"SELECT id, encoded, info FROM tracks WHERE id IN ({placeholders})", track_ids) as cursor:
+            rows = {track_id: (encoded, info) for track_id, encoded, info in await cursor.fetchall()}
+        if len(rows) != len(set(track_ids)):
+            return None
+
+        now = time.time()
+        await db.execute(_TOUCH_QUERY, (now, query))
+        await db.execute(f"UPDATE tracks SET last_used = ? WHERE id IN ({placeholders})", [now, *track_ids])
+        await db.commit()
+
+        payloads = [
+            {"encoded": rows[track_id][0], "info": json.loads(rows[track_id][1]), "pluginInfo": {}, "userData": {}}
+            for track_id in track_ids
+        ]
+        return kind, json.loads(playlist_info) if playlist_info else None, payloads
+
+    # Recording
+
+    async def record(self, query: str, result: "SearchResult") -> None:
+        """Remember what ``query`` resolved to, also mapping each track's URI to itself."""
+        playlist_info = None
+        if isinstance(result, ongaku.Playlist):
+            kind, tracks = PLAYLIST, result.tracks
+            playlist_info = {"name": result.info.name, "selectedTrack": result.info.selected_track}
+        elif isinstance(result, typing.Sequence):
+            kind, tracks = SEARCH, result
+        else:
+            kind, tracks = TRACK, [result] if result is not None else []
+        if not tracks:
+            return
+
+        payloads = [_track_payload(track) for track in tracks]
+        try:
+            async with self._lock:
+                await self._record_locked(query, kind, playlist_info, payloads)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record {len(payloads)} tracks in the track catalog: {e}")
+
+    async def _record_locked(
+        self,
+        query: str,
+        kind: str,
+        playlist_info: typing.Optional[typing.Dict],
+        payloads: typing.List[typing.Dict],
+    ) -> None:
+        now = time.time()
+        db = await self._get_db()
+        track_ids = []
+        for payload in payloads:
+            info = payload["info"]
+            async with db.execute(_UPSERT_TRACK, (
+                payload["encoded"],
+                info["title"],
+                info["author"],
+                info["length"],
+                info["uri"],
+                json.dumps(info, separators=(",", ":")),
+                now,
+            )) as cursor:
+                (track_id,) = await cursor.fetchone()
+            track_ids.append(track_id)
+            if info["uri"]:
+                # Lets autocomplete suggestions, which play by URI, resolve without Lavalink
+                await db.execute(_UPSERT_QUERY, (info["uri"], TRACK, None, json.dumps([track_id]), now))
+
+        await db.execute(_UPSERT_QUERY, (
+            query,
+            kind,
+            json.dumps(playlist_info) if playlist_info is not None else None,
+            json.dumps(track_ids),
+            now,
+        ))
+        await db.commit()
+
+        self._recorded += len(payloads)
+        if self._recorded >= _EVICTION_CHECK_INTERVAL:
+            self._recorded = 0
+            await self._evict_locked(db)
+
+    async def _evict_locked(self, db: "aiosqlite.Connection") -> None:
+        for table in ("tracks", "queries"):
+            async with db.execute(f"SELECT count(*) FROM {table}") as cursor:
+                (count,) = await cursor.fetchone()
+            excess = count - self.max_tracks
+            if excess > 0:
+                await db.execute(_EVICT.format(table=table), (excess,))
+                await db.commit()
+                logger.info(f"Evicted {excess} least recently used rows from the track catalog {table}")
+
+    # Autocomplete
+
+    async def search(self, text: str, limit: int = 25) -> typing.List[typing.Tuple[str, str, str]]:
+        """Up to ``limit`` (title, author, uri) matches for ``text``, best first."""
+        expression = _match_expression(text)
+        if not expression:
+            return []
+
+        try:
+            db = await self._get_db()
+            async with db.execute(_SEARCH, (expression, limit)) as cursor:
+                return [tuple(row) for row in await cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Track catalog search failed: {e}")
+            return []
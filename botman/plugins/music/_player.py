@@ -0,0 +1,51 @@
+import logging
+import typing
+import hikari
+import lightbulb
+import ongaku
+
+from ongaku import errors
+from handlers.session_handler import region_hint
+
+logger = logging.getLogger(__name__)
+
+
+def create_player(bot: lightbulb.BotApp, guild_id: hikari.Snowflakeish, channel_id: hikari.Snowflakeish) -> ongaku.Player:
+    """Get the guild's player, placing a new one on a Lavalink node in the voice channel's region if possible."""
+    channel = bot.cache.get_guild_channel(channel_id)
+    token = region_hint.set(getattr(channel, "region", None))
+    try:
+        return bot.d.ongaku.create_player(guild_id)
+    finally:
+        region_hint.reset(token)
+
+
+def fetch_player(bot: lightbulb.BotApp, guild_id: hikari.Snowflakeish) -> typing.Optional[ongaku.Player]:
+    """The guild's existing player, or None. Unlike ``create_player`` this never places a new player on a node."""
+    try:
+        return bot.d.ongaku.fetch_player(guild_id)
+    except errors.PlayerMissingError:
+        return None
+
+
+async def delete_player(bot: lightbulb.BotApp, guild_id: hikari.Snowflakeish) -> None:
+    """Unregister the guild's player from its node, doing nothing if another teardown already did."""
+    try:
+        await bot.d.ongaku.delete_player(guild_id)
+    except errors.PlayerMissingError:
+        pass
+
+
+async def connect_player(bot: lightbulb.BotApp, player: ongaku.Player, channel_id: hikari.Snowflakeish) -> None:
+    """Connect ``player`` to a voice channel, applying the guild's stored default volume on first connect."""
+    was_connected = player.connected
+    await player.connect(channel_id, deaf=True)
+
+    if was_connected:
+        return
+
+    settings = await bot.d.api_client.get_guild_settings(str(player.guild_id))
+    try:
+        await player.set_volume(settings.music_volume)
+    except Exception as e:
+        logger.error(f"Failed to apply default volume for guild {player.guild_id}: {e}")
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import operator
+import random
+import typing
+
+import ongaku
+
+from ._treap import IndexedQueue
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedTrack:
+    """
+    Compact record of a queued track: Lavalink's encoded string and what the queue displays.
+
+    A full ``ongaku.Track`` also keeps its info object and plugin, user data
+    and info dicts alive; the encoded string alone is enough for Lavalink to
+    rebuild it when the track gets near the play head.
+    """
+
+    __slots__ = ("encoded", "title", "author", "length")
+
+    def __init__(self, encoded: str, title: str, author: str, length: int) -> None:
+        self.encoded = encoded
+        self.title = title
+        self.author = author
+        self.length = length
+
+    @classmethod
+    def from_track(cls, track: ongaku.Track) -> "QueuedTrack":
+        return cls(track.encoded, track.info.title, track.info.author, track.info.length)
+
+
+class MusicQueues:
+    """
+    Per-guild music queues split into a materialized head and a compact backlog.
+
+    Each player's own queue only holds the current track and the next few,
+    ``window`` tracks in total, as full ``Track`` objects. Everything after
+    them is kept as ``QueuedTrack`` records in an ``IndexedQueue`` and decoded
+    by Lavalink in small batches as the head advances, so sizes and total
+    durations are O(1) and pages are read without walking the whole queue.
+    Methods that mutate the player are expected to run through the guild's
+    ``MusicWorkers`` queue.
+    """
+
+    def __init__(self, client: ongaku.Client, window: int = 3) -> None:
+        self.client = client
+        # Playback must always have a next track ready when the current one ends
+        self.window = max(window, 2)
+        self._backlogs: typing.Dict[int, IndexedQueue[QueuedTrack]] = {}
+        # Background tasks still adding playlist tracks, cancelled when the queue is cleared
+        self._loaders: typing.Dict[int, typing.Set[asyncio.Task]] = {}
+        self.materialized = 0
+
+    def backlog_size(self, guild_id: int) -> int:
+        backlog = self._backlogs.get(int(guild_id))
+        return len(backlog) if backlog else 0
+
+    def size(self, guild_id: int, player: ongaku.Player) -> int:
+        """Tracks in the queue, the current one included."""
+        return len(player.queue) + self.backlog_size(guild_id)
+
+    def duration(self, guild_id: int, player: ongaku.Player) -> int:
+        """Total length in milliseconds of every track after the current one."""
+        backlog = self._backlogs.get(int(guild_id))
+        return sum(track.info.length for track in player.queue[1:]) + (backlog.total if backlog else 0)
+
+    def upcoming(
+        self,
+        guild_id: int,
+        player: ongaku.Player,
+        start: int = 0,
+        count: typing.Optional[int] = None,
+    ) -> typing.Iterator[QueuedTrack]:
+        """Tracks after the current one in play order, ``count`` of them from the ``start``-th on."""
+        head = player.queue[1 + start:]
+        if count is None:
+            count = len(head) + self.backlog_size(guild_id)
+        for track in head[:count]:
+            yield QueuedTrack.from_track(track)
+
+        backlog = self._backlogs.get(int(guild_id))
+        if backlog and count > len(head):
+            yield from backlog.window(max(start - (len(player.queue) - 1), 0), count - len(head))
+
+    def add(self, guild_id: int, player: ongaku.Player, tracks: typing.Sequence[ongaku.Track]) -> None:
+        """Append ``tracks``, keeping only what fits in the head window as full tracks."""
+        guild_id = int(guild_id)
+        room = 0 if self._backlogs.get(guild_id) else max(self.window - len(player.queue), 0)
+        if room:
+            player.add(tracks[:room])
+        if len(tracks) > room:
+            backlog = self._backlogs.setdefault(guild_id, IndexedQueue(operator.attrgetter("length")))
+            backlog.extend(QueuedTrack.from_track(track) for track in tracks[room:])
+
+    async def refill(self, guild_id: int, player: ongaku.Player, minimum: int = 0) -> None:
+        """Decode backlog tracks into the player until it holds ``window`` (or ``minimum``) tracks."""
+        guild_id = int(guild_id)
+        backlog = self._backlogs.get(guild_id)
+        missing = max(self.window, minimum) - len(player.queue)
+        if not backlog or missing <= 0:
+            return
+
+        records = list(backlog.window(0, missing))
+        try:
+            tracks = await self.client.rest.decode_tracks([record.encoded for record in records])
+        except Exception as e:
+            logger.error(f"Failed to decode {len(records)} queued tracks for guild {guild_id}: {e}")
+            return
+
+        for _ in records:
+            backlog.pop(0)
+        if not backlog:
+            del self._backlogs[guild_id]
+
+        was_idle = not player.queue
+        player.add(tracks)
+        self.materialized += len(tracks)
+        if was_idle and player.connected:
+            await player.play()
+
+    async def skip(self, guild_id: int, player: ongaku.Player, amount: int = 1) -> None:
+        """Skip ``amount`` tracks, dropping skipped backlog records without ever decoding them."""
+        backlog = self._backlogs.get(int(guild_id))
+        ahead = len(player.queue) - 1
+        if backlog and amount > ahead:
+            dropped = min(amount - ahead - 1, len(backlog))
+            for _ in range(dropped):
+                backlog.pop(0)
+            if not backlog:
+                del self._backlogs[int(guild_id)]
+            amount -= dropped
+            await self.refill(guild_id, player, minimum=amount + 1)
+
+        await player.skip(amount)
+        await self.refill(guild_id, player)
+
+    async def remove(self, guild_id: int, player: ongaku.Player, position: int) -> typing.Optional[str]:
+        """Remove the track at zero-based ``position``, returning its title, or None if there is none."""
+        guild_id = int(guild_id)
+        if 0 <= position < len(player.queue):
+            title = player.queue[position].info.title
+            player.remove(position)
+            await self.refill(guild_id, player)
+            return title
+
+        backlog = self._backlogs.get(guild_id)
+        index = position - len(player.queue)
+        if not backlog or not 0 <= index < len(backlog):
+            return None
+
+        record = backlog.pop(index)
+        if not backlog:
+            del self._backlogs[guild_id]
+        return record.title
+
+    async def shuffle(self, guild_id: int, player: ongaku.Player) -> None:
+        """Shuffle every track after the current one, backlog included."""
+        guild_id = int(guild_id)
+        if not self._backlogs.get(guild_id):
+            player.shuffle()
+            return
+
+        records = list(self.upcoming(guild_id, player))
+        random.shuffle(records)
+        while len(player.queue) > 1:
+            player.remove(len(player.queue) - 1)
+        self._backlogs[guild_id] = IndexedQueue(operator.attrgetter("length"), records)
+        await self.refill(guild_id, player)
+
+    def track_loader(self, guild_id: int, task: asyncio.Task) -> None:
+        """Register a task adding tracks to the guild's queue, so clearing the queue cancels it."""
+        loaders = self._loaders.setdefault(int(guild_id), set())
+        loaders.add(task)
+        task.add_done_callback(loaders.discard)
+
+    def is_loading(self, guild_id: int, task: asyncio.Task) -> bool:
+        """Whether ``task`` may still add tracks, False once the queue was cleared after it started."""
+        return task in self._loaders.get(int(guild_id), ())
+
+    def clear(self, guild_id: int) -> None:
+        """Forget the guild's backlog and cancel its loaders, the player's own queue is cleared by the player."""
+        self._backlogs.pop(int(guild_id), None)
+        for task in self._loaders.pop(int(guild_id), ()):
+            task.cancel()
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        return {
+            "guilds": len(self._backlogs),
+            "backlog": sum(len(backlog) for backlog in self._backlogs.values()),
+            "materialized": self.materialized,
+        }
@@ -0,0 +1,89 @@
+import asyncio
+import typing
+
+import ongaku
+
+from cache.single_flight import SingleFlight
+from cache.ttl_cache import TTLCache
+from ._catalog import TrackCatalog
+
+SearchResult = typing.Union[ongaku.Playlist, typing.Sequence[ongaku.Track], ongaku.Track, None]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Cache key for a Lavalink identifier.
+
+    Search terms (``ytsearch:`` and friends) are case and whitespace
+    insensitive, URLs are kept as they are since their paths are not.
+    """
+    query = query.strip()
+    source, separator, terms = query.partition(":")
+    if separator and source.lower().endswith("search"):
+        return f"{source.lower()}:{' '.join(terms.lower().split())}"
+    return query
+
+
+class TrackSearch:
+    """
+    Lavalink track loading with a bounded TTL cache and coalesced concurrent searches.
+
+    Results are shared between guilds, so a popular query only hits Lavalink
+    once per ``ttl``. Empty results are not cached, they are often transient.
+    When a ``catalog`` is given, queries it resolved before are answered from
+    it and new Lavalink results are recorded in it in the background.
+    """
+
+    def __init__(
+        self,
+        client: ongaku.Client,
+        catalog: typing.Optional[TrackCatalog] = None,
+        maxsize: int = 1_000,
+        ttl: float = 600,
+    ) -> None:
+        self.client = client
+        self.catalog = catalog
+        self.cache: TTLCache[str, SearchResult] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: SingleFlight[str, SearchResult] = SingleFlight()
+        self._recording: typing.Set[asyncio.Task] = set()
+        self.catalog_hits = 0
+        self.lavalink_loads = 0
+
+    async def load(self, query: str) -> SearchResult:
+        """Load ``query`` (already rewritten with its source prefix), served from the cache when possible."""
+        key = normalize_query(query)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+
+        return await self._inflight.do(key, lambda: self._load(key))
+
+    async def _load(self, key: str) -> SearchResult:
+        if self.catalog is not None:
+            result = await self.catalog.resolve(key)
+            if result:
+                self.catalog_hits += 1
+                self.cache.set(key, result)
+                return result
+
+        self.lavalink_loads += 1
+        result = await self.client.rest.load_track(key)
+        if result:
+            self.cache.set(key, result)
+            if self.catalog is not None:
+                # Recording is not needed to answer this play, keep it off the critical path
+                task = asyncio.create_task(self.catalog.record(key, result))
+                self._recording.add(task)
+                task.add_done_callback(self._recording.discard)
+        return result
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """Where searches were answered from: cache, coalesced into another search, catalog or Lavalink."""
+        return {
+            "searches": self.cache.hits + self.cache.misses,
+            "cache_hits": self.cache.hits,
+            "coalesced": self._inflight.coalesced,
+            "catalog_hits": self.catalog_hits,
+            "lavalink_loads": self.lavalink_loads,
+        }
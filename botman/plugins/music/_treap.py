@@ -0,0 +1,140 @@
+import random
+import typing
+
+T = typing.TypeVar("T")
+
+
+class _Node:
+    __slots__ = ("value", "weight", "priority", "left", "right", "size", "total")
+
+    def __init__(self, value: typing.Any, weight: int) -> None:
+        self.value = value
+        self.weight = weight
+        self.priority = random.random()
+        self.left: typing.Optional[_Node] = None
+        self.right: typing.Optional[_Node] = None
+        self.size = 1
+        self.total = weight
+
+
+def _size(node: typing.Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _total(node: typing.Optional[_Node]) -> int:
+    return node.total if node is not None else 0
+
+
+def _update(node: _Node) -> _Node:
+    node.size = 1 + _size(node.left) + _size(node.right)
+    node.total = node.weight + _total(node.left) + _total(node.right)
+    return node
+
+
+def _merge(left: typing.Optional[_Node], right: typing.Optional[_Node]) -> typing.Optional[_Node]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+def _split(
+    node: typing.Optional[_Node],
+    count: int,
+) -> typing.Tuple[typing.Optional[_Node], typing.Optional[_Node]]:
+    """Split into the first ``count`` values and the rest."""
+    if node is None:
+        return None, None
+    if _size(node.left) >= count:
+        left, node.left = _split(node.left, count)
+        return left, _update(node)
+    node.right, right = _split(node.right, count - _size(node.left) - 1)
+    return _update(node), right
+
+
+class IndexedQueue(typing.Generic[T]):
+    """
+    Sequence backed by an implicit treap, ordered by position rather than by key.
+
+    Every node keeps the size and the summed ``weight`` of its subtree, so
+    the length and total weight are O(1), positional insertion and removal
+    are O(log n), and a window of ``k`` values is read in O(log n + k)
+    without walking what comes before it.
+    """
+
+    def __init__(self, weight: typing.Callable[[T], int], values: typing.Iterable[T] = ()) -> None:
+        self._weight = weight
+        self._root: typing.Optional[_Node] = None
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __iter__(self) -> typing.Iterator[T]:
+        return self.window(0, len(self))
+
+    @property
+    def total(self) -> int:
+        """Sum of every value's weight."""
+        return _total(self._root)
+
+    def append(self, value: T) -> None:
+        self._root = _merge(self._root, _Node(value, self._weight(value)))
+
+    def extend(self, values: typing.Iterable[T]) -> None:
+        for value in values:
+            self.append(value)
+
+    def insert(self, index: int, value: T) -> None:
+        left, right = _split(self._root, max(0, min(index, len(self))))
+        self._root = _merge(_merge(left, _Node(value, self._weight(value))), right)
+
+    def pop(self, index: int = 0) -> T:
+        if not 0 <= index < len(self):
+            raise IndexError("queue index out of range")
+        left, rest = _split(self._root, index)
+        node, right = _split(rest, 1)
+        self._root = _merge(left, right)
+        return node.value
+
+    def clear(self) -> None:
+        self._root = None
+
+    def __getitem__(self, index: int) -> T:
+        if not 0 <= index < len(self):
+            raise IndexError("queue index out of range")
+        return next(self.window(index, 1))
+
+    def window(self, start: int, count: int) -> typing.Iterator[T]:
+        """Up to ``count`` values from position ``start`` on, skipping whole subtrees before it."""
+        stack: typing.List[_Node] = []
+        node = self._root
+        # Descend to ``start``, only keeping the ancestors whose own value comes after it
+        while node is not None:
+            left_size = _size(node.left)
+            if start < left_size:
+                stack.append(node)
+                node = node.left
+            elif start == left_size:
+                stack.append(node)
+                break
+            else:
+                start -= left_size + 1
+                node = node.right
+
+        while stack and count > 0:
+            node = stack.pop()
+            yield node.value
+            count -= 1
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
@@ -0,0 +1,195 @@
+import asyncio
+import collections
+import logging
+import typing
+
+import ongaku
+
+from ._queue import MusicQueues
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+# Operation kinds, only these are ever coalesced
+SKIP = "skip"
+TOGGLE_PAUSE = "toggle_pause"
+STOP = "stop"
+
+# Pending operations made pointless by a newer one of the given kind
+_SUPERSEDED_BY = {
+    STOP: (SKIP, TOGGLE_PAUSE, STOP),
+}
+
+
+class _Operation:
+    __slots__ = ("kind", "action", "amount", "future")
+
+    def __init__(
+        self,
+        kind: typing.Optional[str],
+        action: typing.Callable[["_Operation"], typing.Awaitable[typing.Any]],
+        future: asyncio.Future,
+    ) -> None:
+        self.kind = kind
+        self.action = action
+        self.amount = 1
+        self.future = future
+
+    def resolve(self, result: typing.Any = None) -> None:
+        if not self.future.done():
+            self.future.set_result(result)
+
+
+class GuildWorker:
+    """
+    Runs one guild's player operations one at a time, in submission order.
+
+    Operations still waiting to run are merged with redundant newcomers:
+    consecutive skips become a single skip of several tracks, two pending
+    pause toggles cancel out, and a stop drops any pending skips, toggles
+    and stops. The worker exits after ``idle_timeout`` seconds without work.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        idle_timeout: float,
+        on_idle: typing.Callable[[int], None],
+    ) -> None:
+        self.guild_id = guild_id
+        self._idle_timeout = idle_timeout
+        self._on_idle = on_idle
+        self._pending: typing.Deque[_Operation] = collections.deque()
+        self._wakeup = asyncio.Event()
+        self.executed = 0
+        self.coalesced = 0
+        self._task = asyncio.create_task(self._run())
+
+    def submit(
+        self,
+        kind: typing.Optional[str],
+        action: typing.Callable[[_Operation], typing.Awaitable[T]],
+    ) -> "asyncio.Future[T]":
+        future = asyncio.get_running_loop().create_future()
+        tail = self._pending[-1] if self._pending else None
+
+        if kind == SKIP and tail is not None and tail.kind == SKIP:
+            tail.amount += 1
+            self.coalesced += 1
+            return tail.future
+
+        if kind == TOGGLE_PAUSE and tail is not None and tail.kind == TOGGLE_PAUSE:
+            # Two toggles in a row leave the player as it was
+            self._pending.pop()
+            tail.resolve()
+            self.coalesced += 2
+            future.set_result(None)
+            return future
+
+        superseded = _SUPERSEDED_BY.get(kind)
+        if superseded:
+            kept = collections.deque()
+            for operation in self._pending:
+                if operation.kind in superseded:
+                    operation.resolve()
+                    self.coalesced += 1
+                else:
+                    kept.append(operation)
+            self._pending = kept
+
+        self._pending.append(_Operation(kind, action, future))
+        self._wakeup.set()
+        return future
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._idle_timeout)
+                except asyncio.TimeoutError:
+                    # Nothing can be submitted between this check and leaving, no await in between
+                    if not self._pending:
+                        self._on_idle(self.guild_id)
+                        return
+                continue
+
+            operation = self._pending.popleft()
+            try:
+                operation.resolve(await operation.action(operation))
+            except Exception as e:
+                if not operation.future.done():
+                    operation.future.set_exception(e)
+            self.executed += 1
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        for operation in self._pending:
+            operation.future.cancel()
+        self._pending.clear()
+
+
+class MusicWorkers:
+    """Per-guild serialized work queues for everything that mutates an ongaku player."""
+
+    def __init__(self, queues: MusicQueues, idle_timeout: float = 300) -> None:
+        self.queues = queues
+        self.idle_timeout = idle_timeout
+        self._workers: typing.Dict[int, GuildWorker] = {}
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def _worker(self, guild_id: int) -> GuildWorker:
+        worker = self._workers.get(guild_id)
+        if worker is None:
+            worker = self._workers[guild_id] = GuildWorker(guild_id, self.idle_timeout, self._reap)
+        return worker
+
+    def _reap(self, guild_id: int) -> None:
+        worker = self._workers.pop(guild_id, None)
+        if worker is not None:
+            logger.debug(f"Reaped idle music worker for guild {guild_id} after {worker.executed} operations")
+
+    async def _submit(
+        self,
+        guild_id: int,
+        kind: typing.Optional[str],
+        action: typing.Callable[[_Operation], typing.Awaitable[T]],
+    ) -> T:
+        # Shielded so a caller giving up does not cancel work other callers share
+        return await asyncio.shield(self._worker(int(guild_id)).submit(kind, action))
+
+    async def run(self, guild_id: int, func: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Run ``func`` once every operation submitted before it for the guild has finished."""
+        return await self._submit(guild_id, None, lambda _: func())
+
+    async def skip(self, guild_id: int, player: ongaku.Player) -> None:
+        """Skip the current track, merged with any skips still waiting to run."""
+        await self._submit(
+            guild_id, SKIP, lambda operation: self.queues.skip(guild_id, player, operation.amount)
+        )
+
+    async def toggle_pause(self, guild_id: int, player: ongaku.Player) -> None:
+        """Toggle pause, cancelled out by an opposite toggle still waiting to run."""
+        await self._submit(guild_id, TOGGLE_PAUSE, lambda _: player.pause())
+
+    async def stop(self, guild_id: int, func: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Run a stopping ``func``, dropping pending skips and toggles it makes pointless, and the queue backlog."""
+        async def action(_: _Operation) -> T:
+            self.queues.clear(guild_id)
+            return await func()
+
+        return await self._submit(guild_id, STOP, action)
+
+    async def close(self) -> None:
+        """Stop every worker, cancelling operations that have not started."""
+        workers = list(self._workers.values())
+        self._workers.clear()
+        for worker in workers:
+            await worker.stop()
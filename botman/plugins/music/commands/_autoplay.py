@@ -2,6 +2,7 @@ import lightbulb
 import hikari
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class AutoplayCommand(BaseCommand):
@@ -21,9 +22,9 @@ class AutoplayCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected:
+        if player is None or not player.connected:
             await ctx.respond("Not connected to a voice channel!")
             return
             
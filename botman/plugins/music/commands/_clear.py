@@ -2,6 +2,7 @@ import lightbulb
 import hikari
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class ClearCommand(BaseCommand):
@@ -20,11 +21,15 @@ class ClearCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected:
+        if player is None or not player.connected:
             await ctx.respond("Not connected to a voice channel!")
             return
             
-        await player.clear()
+        async def clear() -> None:
+            ctx.bot.d.music_queues.clear(ctx.guild_id)
+            await player.clear()
+
+        await ctx.bot.d.music_workers.run(ctx.guild_id, clear)
         await ctx.respond("Queue cleared!")
\ No newline at end of file
@@ -3,6 +3,7 @@ import hikari
 import logging
 
 from base.command import BaseCommand
+from .._player import connect_player, create_player
 
 
 class JoinCommand(BaseCommand):
@@ -30,8 +31,8 @@ class JoinCommand(BaseCommand):
             
         channel_id = voice_state[0].channel_id
         try:
-            player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
-            await player.connect(channel_id, deaf=True)
+            player = create_player(ctx.bot, ctx.guild_id, channel_id)
+            await connect_player(ctx.bot, player, channel_id)
             await ctx.respond(f"Joined <#{channel_id}>!")
         except Exception as e:
             logging.error(f"Failed to join voice channel: {e}")
@@ -1,3 +1,4 @@
+import asyncio
 import lightbulb
 import hikari
 import ongaku
@@ -6,6 +7,11 @@ import typing
 
 from base.command import BaseCommand
 from views.music_view import MusicPlayerView
+from .._player import connect_player, create_player
+
+
+# Tracks added to the queue per worker operation when loading the rest of a playlist
+ENQUEUE_CHUNK_SIZE = 100
 
 
 class PlayCommand(BaseCommand):
@@ -17,13 +23,34 @@ class PlayCommand(BaseCommand):
     def create_command(self) -> lightbulb.Command:
         @self.plugin.command
         @lightbulb.add_checks(lightbulb.guild_only)
-        @lightbulb.option("query", "The song/playlist to play", type=str, required=True, modifier=lightbulb.OptionModifier.CONSUME_REST)
+        @lightbulb.option("query", "The song/playlist to play", type=str, required=True, modifier=lightbulb.OptionModifier.CONSUME_REST, autocomplete=True)
         @lightbulb.command(self.name, self.description)
         @lightbulb.implements(lightbulb.SlashCommand, lightbulb.PrefixCommand)
         async def cmd(ctx: lightbulb.Context) -> None:
             await self.execute(ctx)
+
+        @cmd.autocomplete("query")
+        async def query_autocomplete(
+            option: hikari.AutocompleteInteractionOption,
+            interaction: hikari.AutocompleteInteraction,
+        ) -> typing.List[hikari.CommandChoice]:
+            return await self.autocomplete(str(option.value or ""))
+
         return cmd
 
+    async def autocomplete(self, text: str) -> typing.List[hikari.CommandChoice]:
+        """Suggest previously played tracks from the local catalog, playing them by URI skips the Lavalink search."""
+        catalog = self.plugin.bot.d.track_catalog
+        if catalog is None or len(text) < 2:
+            return []
+
+        choices = []
+        for title, author, uri in await catalog.search(text):
+            # Discord caps choice names and values at 100 characters
+            if len(uri) <= 100:
+                choices.append(hikari.CommandChoice(name=f"{title} - {author}"[:100], value=uri))
+        return choices
+
     async def execute(self, ctx: lightbulb.Context) -> None:
         SOURCE_PREFIXES = {
             "spotify:": "spsearch:",
@@ -39,10 +66,11 @@ class PlayCommand(BaseCommand):
             return
 
         try:
-            player = ctx.bot.d.ongaku.create_player(ctx.get_guild())
+            player = create_player(ctx.bot, ctx.guild_id, voice_state.channel_id)
+            workers = ctx.bot.d.music_workers
             
             if not player.connected:
-                await player.connect(voice_state.channel_id, deaf=True)
+                await workers.run(ctx.guild_id, lambda: connect_player(ctx.bot, player, voice_state.channel_id))
 
             loading_msg = await ctx.respond("🔍 Searching...", flags=hikari.MessageFlag.EPHEMERAL)
 
@@ -56,63 +84,36 @@ class PlayCommand(BaseCommand):
                 else:
                     query = f"ytsearch:{query}"
 
-            result = await ctx.bot.d.ongaku.rest.load_track(query)
+            result = await ctx.bot.d.track_search.load(query)
             
             if result is None:
                 await loading_msg.edit("❌ No results found!")
                 return
 
-            was_playing = bool(player.queue)
-
-            if isinstance(result, typing.Sequence):
+            if isinstance(result, (ongaku.Playlist, typing.Sequence)):
+                tracks = list(result.tracks if isinstance(result, ongaku.Playlist) else result)
+                if not tracks:
+                    await loading_msg.edit("❌ No results found!")
+                    return
                 if not is_direct_url:
-                    tracks = [result[0]]
-                else:
-                    tracks = result
-                
+                    tracks = tracks[:1]
+
                 first_track = tracks[0]
-                player.add(tracks)
-                
-                embed = hikari.Embed(
-                    title="Playlist Added" if len(tracks) > 1 else "Track Added",
-                    description=f"Added {len(tracks)} tracks to the queue" if len(tracks) > 1 else f"Added track to the queue",
-                    color=hikari.Color(0x3498db)
-                )
-                
-                track_list = "\n".join(
-                    f"`{i+1}.` {track.info.title}"
-                    for i, track in enumerate(tracks[:5])
-                )
-                if len(tracks) > 5:
-                    track_list += f"\n... and {len(tracks) - 5} more"
-                
-                embed.add_field(
-                    name="Tracks" if len(tracks) > 1 else "Track",
-                    value=track_list,
-                    inline=False
-                )
-                
-                total_duration = sum(track.info.length for track in tracks)
-                minutes, seconds = divmod(total_duration // 1000, 60)
-                hours, minutes = divmod(minutes, 60)
-                
-                duration_str = f"{hours}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes}:{seconds:02d}"
-                    
-                embed.add_field(
-                    name="Total Duration",
-                    value=duration_str,
-                    inline=True
-                )
-                
-                await loading_msg.edit(embed=embed)
-                
+                # Start audio on the first track before touching the rest of a playlist
+                was_playing = await workers.run(ctx.guild_id, lambda: self.enqueue(ctx, player, [first_track]))
                 if not was_playing:
-                    await player.play()
                     await self.update_music_view(ctx, player, first_track)
+
+                if len(tracks) > 1:
+                    await loading_msg.edit(f"🎵 Queued **{first_track.info.title}**, adding {len(tracks) - 1} more tracks...")
+                    task = asyncio.create_task(self.enqueue_remaining(ctx, player, tracks, loading_msg))
+                    ctx.bot.d.music_queues.track_loader(ctx.guild_id, task)
+                else:
+                    await loading_msg.edit(embed=self.create_added_embed(tracks))
                     
             else:
                 track = result
-                player.add(track)
+                was_playing = await workers.run(ctx.guild_id, lambda: self.enqueue(ctx, player, [track]))
                 
                 duration = track.info.length // 1000
                 minutes, seconds = divmod(duration, 60)
@@ -136,7 +137,7 @@ class PlayCommand(BaseCommand):
                     )
                 
                 if was_playing:
-                    position = len(player.queue)
+                    position = ctx.bot.d.music_queues.size(ctx.guild_id, player)
                     embed.add_field(
                         name="Position",
                         value=f"#{position} in queue",
@@ -146,15 +147,89 @@ class PlayCommand(BaseCommand):
                 await loading_msg.edit(embed=embed)
                 
                 if not was_playing:
-                    await player.play()
                     await self.update_music_view(ctx, player, track)
 
         except Exception as e:
             logging.error(f"Error in play command: {e}", exc_info=True)
             await ctx.respond(f"An error occurred: {str(e)}")
 
+    async def enqueue_remaining(
+        self,
+        ctx: lightbulb.Context,
+        player: ongaku.Player,
+        tracks: typing.Sequence[ongaku.Track],
+        loading_msg: lightbulb.ResponseProxy,
+    ) -> None:
+        """
+        Queue everything after the first track in chunks, then post the playlist summary once.
+
+        Clearing or stopping the queue cancels this task, a chunk already
+        waiting on the guild's worker is then dropped instead of added.
+        """
+        workers = ctx.bot.d.music_workers
+        queues = ctx.bot.d.music_queues
+        task = asyncio.current_task()
+
+        async def add_chunk(chunk: typing.Sequence[ongaku.Track]) -> None:
+            if queues.is_loading(ctx.guild_id, task):
+                # Playback may have ended, or been cleared, before this chunk arrived
+                await self.enqueue(ctx, player, chunk)
+
+        try:
+            for start in range(1, len(tracks), ENQUEUE_CHUNK_SIZE):
+                if not player.connected:
+                    return
+                chunk = tracks[start:start + ENQUEUE_CHUNK_SIZE]
+                await workers.run(ctx.guild_id, lambda: add_chunk(chunk))
+
+            await loading_msg.edit(content=None, embed=self.create_added_embed(tracks))
+        except Exception as e:
+            logging.error(f"Failed to enqueue playlist in guild {ctx.guild_id}: {e}", exc_info=True)
+
+    def create_added_embed(self, tracks: typing.Sequence[ongaku.Track]) -> hikari.Embed:
+        embed = hikari.Embed(
+            title="Playlist Added" if len(tracks) > 1 else "Track Added",
+            description=f"Added {len(tracks)} tracks to the queue" if len(tracks) > 1 else f"Added track to the queue",
+            color=hikari.Color(0x3498db)
+        )
+        
+        track_list = "\n".join(
+            f"`{i+1}.` {track.info.title}"
+            for i, track in enumerate(tracks[:5])
+        )
+        if len(tracks) > 5:
+            track_list += f"\n... and {len(tracks) - 5} more"
+        
+        embed.add_field(
+            name="Tracks" if len(tracks) > 1 else "Track",
+            value=track_list,
+            inline=False
+        )
+        
+        total_duration = sum(track.info.length for track in tracks)
+        minutes, seconds = divmod(total_duration // 1000, 60)
+        hours, minutes = divmod(minutes, 60)
+        
+        duration_str = f"{hours}:{minutes:02d}:{seconds:02d}" if hours > 0 else f"{minutes}:{seconds:02d}"
+            
+        embed.add_field(
+            name="Total Duration",
+            value=duration_str,
+            inline=True
+        )
+        return embed
+
+    @staticmethod
+    async def enqueue(ctx: lightbulb.Context, player: ongaku.Player, tracks: typing.Sequence[ongaku.Track]) -> bool:
+        """Add ``tracks`` and start playback if idle. Returns whether something was already playing."""
+        was_playing = bool(player.queue)
+        ctx.bot.d.music_queues.add(ctx.guild_id, player, tracks)
+        if not was_playing:
+            await player.play()
+        return was_playing
+
     async def update_music_view(self, ctx: lightbulb.Context, player: ongaku.Player, track: ongaku.Track) -> None:
-        view = MusicPlayerView(player)
+        view = MusicPlayerView(player, ctx.bot.d.music_workers)
         embed = self.create_now_playing_embed(track)
         
         try:
@@ -2,6 +2,7 @@ import lightbulb
 import hikari
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class RemoveCommand(BaseCommand):
@@ -21,18 +22,20 @@ class RemoveCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected or not player.queue:
+        if player is None or not player.connected or not player.queue:
             await ctx.respond("Queue is empty!")
             return
             
         try:
+            queues = ctx.bot.d.music_queues
             position = ctx.options.position - 1
-            if 0 <= position < len(player.queue):
-                removed_track = player.queue[position]
-                player.remove(position)
-                await ctx.respond(f"Removed: {removed_track.info.title}")
+            title = await ctx.bot.d.music_workers.run(
+                ctx.guild_id, lambda: queues.remove(ctx.guild_id, player, position)
+            )
+            if title is not None:
+                await ctx.respond(f"Removed: {title}")
             else:
                 await ctx.respond("Invalid queue position!")
         except Exception as e:
@@ -2,6 +2,7 @@ import lightbulb
 import hikari
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class ShuffleCommand(BaseCommand):
@@ -20,11 +21,12 @@ class ShuffleCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected or len(player.queue) < 2:
+        queues = ctx.bot.d.music_queues
+        if player is None or not player.connected or queues.size(ctx.guild_id, player) < 2:
             await ctx.respond("Not enough tracks in the queue to shuffle!")
             return
             
-        player.shuffle()
+        await ctx.bot.d.music_workers.run(ctx.guild_id, lambda: queues.shuffle(ctx.guild_id, player))
         await ctx.respond("Queue shuffled!")
\ No newline at end of file
@@ -2,6 +2,7 @@ import lightbulb
 import hikari
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class SkipCommand(BaseCommand):
@@ -20,11 +21,11 @@ class SkipCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected or not player.queue:
+        if player is None or not player.connected or not player.queue:
             await ctx.respond("Nothing is playing!")
             return
             
-        await player.skip()
+        await ctx.bot.d.music_workers.skip(ctx.guild_id, player)
         await ctx.respond("Skipped the current track!")
\ No newline at end of file
@@ -2,6 +2,7 @@ import lightbulb
 import logging
 
 from base.command import BaseCommand
+from .._player import delete_player, fetch_player
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +23,9 @@ class StopCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected:
+        if player is None or not player.connected:
             await ctx.respond("Not connected to a voice channel!")
             return
         
@@ -45,11 +46,14 @@ class StopCommand(BaseCommand):
                 bot.d.voice_timeouts[guild_id].cancel()
                 del bot.d.voice_timeouts[guild_id]
 
-            player = bot.d.ongaku.create_player(guild_id)
-            if player:
-                await player.stop()
-                await player.disconnect()
-                bot.d.ongaku.delete_player(guild_id)
+            player = fetch_player(bot, guild_id)
+            if player is not None:
+                async def teardown() -> None:
+                    await player.stop()
+                    await player.disconnect()
+                    await delete_player(bot, guild_id)
+
+                await bot.d.music_workers.stop(guild_id, teardown)
 
         except Exception as e:
             logging.error(f"Error during player cleanup: {e}")
\ No newline at end of file
@@ -1,6 +1,7 @@
 import lightbulb
 
 from base.command import BaseCommand
+from .._player import fetch_player
 
 
 class VolumeCommand(BaseCommand):
@@ -20,9 +21,9 @@ class VolumeCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        player = ctx.bot.d.ongaku.create_player(ctx.guild_id)
+        player = fetch_player(ctx.bot, ctx.guild_id)
         
-        if not player.connected:
+        if player is None or not player.connected:
             await ctx.respond("Not connected to a voice channel!")
             return
             
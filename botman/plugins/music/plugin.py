@@ -1,7 +1,14 @@
-import os
+import hikari
 import lightbulb
+import ongaku
 
 from base.plugin import BasePlugin
+from config import LavalinkConfig
+from ._catalog import TrackCatalog
+from ._player import fetch_player
+from ._queue import MusicQueues
+from ._search import TrackSearch
+from ._worker import MusicWorkers
 from .commands._join import JoinCommand
 from .commands._play import PlayCommand
 from .commands._queue import QueueCommand
@@ -17,6 +24,14 @@ from .commands._leave import LeaveCommand
 
 
 class MusicPlugin(BasePlugin):
+    intents = hikari.Intents.GUILD_VOICE_STATES
+    cache_components = hikari.api.CacheComponents.VOICE_STATES
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Music needs a Lavalink server, enabled with ENABLE_LAVALINK"""
+        return LavalinkConfig().enabled
+
     @property
     def plugin_name(self) -> str:
         return "music"
@@ -41,18 +56,49 @@ class MusicPlugin(BasePlugin):
             LeaveCommand(self.plugin)
         ]
 
+    def load(self) -> None:
+        """Load plugin into bot, releasing its shared music state on shutdown"""
+        self.plugin.listener(hikari.StoppingEvent)(self.on_stopping)
+        self.plugin.listener(ongaku.TrackEndEvent)(self.on_track_end)
+        super().load()
+
+    async def on_track_end(self, event: ongaku.TrackEndEvent) -> None:
+        """Top up the player's materialized head window from the compact backlog"""
+        queues = self.bot.d.music_queues
+        if not queues.backlog_size(event.guild_id):
+            return
+
+        player = fetch_player(self.bot, event.guild_id)
+        if player is None:
+            return
+        await self.bot.d.music_workers.run(event.guild_id, lambda: queues.refill(event.guild_id, player))
+
+    async def on_stopping(self, event: hikari.StoppingEvent) -> None:
+        await self.bot.d.music_workers.close()
+        if self.bot.d.track_catalog is not None:
+            await self.bot.d.track_catalog.close()
+
 
 def load(bot: lightbulb.BotApp) -> None:
-    enable_lavalink = os.getenv("ENABLE_LAVALINK", False)
-    
-    if enable_lavalink:
+    if MusicPlugin.is_enabled():
+        config = LavalinkConfig()
+        bot.d.music_queues = MusicQueues(bot.d.ongaku, config.queue_window)
+        bot.d.music_workers = MusicWorkers(bot.d.music_queues, config.worker_idle_timeout)
+        bot.d.track_catalog = (
+            TrackCatalog(bot.d.ongaku, config.catalog_path, config.catalog_max_tracks)
+            if config.catalog_path else None
+        )
+        bot.d.track_search = TrackSearch(
+            bot.d.ongaku,
+            bot.d.track_catalog,
+            config.search_cache_size,
+            config.search_cache_ttl,
+        )
         plugin = MusicPlugin(bot)
         plugin.load()
 
 
 def unload(bot: lightbulb.BotApp) -> None:
-    enable_lavalink = os.getenv("ENABLE_LAVALINK", False)
-
-    if enable_lavalink:
+    if MusicPlugin.is_enabled():
         plugin = MusicPlugin(bot)
         plugin.unload()
\ No newline at end of file
@@ -44,10 +44,10 @@ class PrefixCommand(BaseCommand):
                     color=hikari.Color(0xff0000)
                 )
         else:
-            current_prefix = await ctx.bot.d.api_client.get_guild_prefix(str(ctx.guild_id))
+            settings = await ctx.bot.d.api_client.get_guild_settings(str(ctx.guild_id))
             embed = hikari.Embed(
                 title="Current Prefix",
-                description=f"The current server prefix is: `{current_prefix}`",
+                description=f"The current server prefix is: `{settings.prefix}`",
                 color=hikari.Color(0x00ff00)
             )
         
@@ -1,5 +1,6 @@
 import lightbulb
 import hikari
+import typing
 from datetime import datetime
 
 from base.command import BaseCommand
@@ -20,9 +21,9 @@ class SnipeCommand(BaseCommand):
         return cmd
 
     async def execute(self, ctx: lightbulb.Context) -> None:
-        messages = await ctx.bot.d.api_client.get_recent_deleted_messages(str(ctx.guild_id))
+        message = await self._find_deleted_message(ctx)
         
-        if not messages:
+        if not message:
             embed = hikari.Embed(
                 title="No Messages Found",
                 description="There are no recently deleted messages to show.",
@@ -31,7 +32,6 @@ class SnipeCommand(BaseCommand):
             await ctx.respond(embed=embed)
             return
 
-        message = messages[0]  # Get most recent
         embed = hikari.Embed(
             title="Deleted Message",
             color=hikari.Color(0x00ff00)
@@ -41,4 +41,19 @@ class SnipeCommand(BaseCommand):
         embed.add_field("Channel", f"<#{message['channel_id']}>")
         embed.set_footer(text=f"Message ID: {message['message_id']}")
         
-        await ctx.respond(embed=embed)
\ No newline at end of file
+        await ctx.respond(embed=embed)
+
+    async def _find_deleted_message(self, ctx: lightbulb.Context) -> typing.Optional[typing.Dict]:
+        """Serve the snipe from the local ring buffer, falling back to the backend, within the snipe timeout."""
+        channel_id = str(ctx.channel_id)
+        max_age = ctx.bot.message_handler.retention_config.snipe_timeout
+        record = ctx.bot.message_handler.snipe_cache.latest_deleted(channel_id, max_age)
+        if record:
+            return record.to_dict()
+
+        messages = await ctx.bot.d.api_client.get_recent_deleted_messages(str(ctx.guild_id), max_age)
+        if not messages:
+            return None
+
+        # Prefer the most recent message from this channel, otherwise the most recent in the guild
+        return next((message for message in messages if message["channel_id"] == channel_id), messages[0])
\ No newline at end of file
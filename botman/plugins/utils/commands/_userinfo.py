@@ -22,7 +22,7 @@ class UserInfoCommand(BaseCommand):
 
     async def execute(self, ctx: lightbulb.Context) -> None:
         target = ctx.options.user or ctx.author
-        member = ctx.get_guild().get_member(target.id)
+        member = await ctx.bot.member_resolver.resolve(ctx.guild_id, target.id)
         
         roles = [role.mention for role in member.get_roles()] if member else []
         roles_str = ", ".join(roles) if roles else "No roles"
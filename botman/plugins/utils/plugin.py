@@ -1,3 +1,4 @@
+import hikari
 import lightbulb
 
 from base.plugin import BasePlugin
@@ -12,6 +13,9 @@ from .commands._prefix import PrefixCommand
 
 
 class UtilsPlugin(BasePlugin):
+    intents = hikari.Intents.GUILD_MEMBERS
+    cache_components = hikari.api.CacheComponents.MEMBERS | hikari.api.CacheComponents.ROLES
+
     @property
     def plugin_name(self) -> str:
         return "utility"
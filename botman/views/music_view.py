@@ -5,10 +5,14 @@ import typing
 
 from typing import Literal
 
+from plugins.music._worker import MusicWorkers
+
 class MusicPlayerView(miru.View):
-    def __init__(self, player: ongaku.Player) -> None:
+    def __init__(self, player: ongaku.Player, workers: MusicWorkers) -> None:
         super().__init__(timeout=None)
         self.player = player
+        # Per-guild music work queues, player mutations go through them so button spam is serialized
+        self.workers = workers
         # Initialize play/pause button with play state
         self._update_play_pause_button()
         
@@ -36,7 +40,7 @@ class MusicPlayerView(miru.View):
             await ctx.respond("No track is currently playing!", flags=hikari.MessageFlag.EPHEMERAL)
             return
         
-        await self.player.set_position(0)
+        await self.workers.run(self.player.guild_id, lambda: self.player.set_position(0))
         await ctx.respond("Restarted current track!", flags=hikari.MessageFlag.EPHEMERAL)
 
     @miru.button(emoji="▶️", style=hikari.ButtonStyle.SUCCESS, row=0)
@@ -45,7 +49,7 @@ class MusicPlayerView(miru.View):
             await ctx.respond("No track is currently playing!", flags=hikari.MessageFlag.EPHEMERAL)
             return
 
-        await self.player.pause()  # Toggle pause state
+        await self.workers.toggle_pause(self.player.guild_id, self.player)
         self._update_play_pause_button()
         
         status = "Resumed" if not self.player.is_paused else "Paused"
@@ -57,7 +61,7 @@ class MusicPlayerView(miru.View):
             await ctx.respond("No track is currently playing!", flags=hikari.MessageFlag.EPHEMERAL)
             return
 
-        await self.player.skip()
+        await self.workers.skip(self.player.guild_id, self.player)
         await ctx.respond("Skipped track!", flags=hikari.MessageFlag.EPHEMERAL)
 
     @miru.button(emoji="🔁", style=hikari.ButtonStyle.SECONDARY, row=1)
@@ -87,7 +91,7 @@ class MusicPlayerView(miru.View):
             await ctx.respond("No track is currently playing!", flags=hikari.MessageFlag.EPHEMERAL)
             return
 
-        await self.player.stop()
+        await self.workers.stop(self.player.guild_id, self.player.stop)
         # Reset play/pause button to play state
         self.play_pause_button.emoji = "▶️"
         self.play_pause_button.style = hikari.ButtonStyle.SUCCESS
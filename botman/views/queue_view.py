@@ -0,0 +1,104 @@
+import hikari
+import miru
+import ongaku
+
+from plugins.music._queue import MusicQueues
+
+PAGE_SIZE = 10
+
+
+class QueueView(miru.View):
+    def __init__(self, player: ongaku.Player, queues: MusicQueues, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.player = player
+        self.queues = queues
+        self.current_page = 0
+        self._update_buttons()
+
+    @property
+    def page_count(self) -> int:
+        upcoming = max(self.queues.size(self.player.guild_id, self.player) - 1, 0)
+        return max((upcoming + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+
+    def _update_buttons(self) -> None:
+        # The queue may have shrunk since the last page was shown
+        self.current_page = min(self.current_page, self.page_count - 1)
+        self.previous_button.disabled = self.current_page == 0
+        self.next_button.disabled = self.current_page >= self.page_count - 1
+
+    def render(self) -> hikari.Embed:
+        """Embed for the current page, only this page's tracks are read from the queue"""
+        embed = hikari.Embed(
+            title="Music Queue",
+            color=hikari.Color(0x3498db)
+        )
+
+        if not self.player.queue:
+            embed.description = "The queue is empty!"
+            return embed
+
+        current_track = self.player.queue[0]
+        minutes, seconds = divmod(current_track.info.length // 1000, 60)
+        embed.add_field(
+            name="Now Playing",
+            value=f"🎵 {current_track.info.title}\n`{minutes:02d}:{seconds:02d}` - {current_track.info.author}",
+            inline=False
+        )
+
+        queue_size = self.queues.size(self.player.guild_id, self.player)
+        if queue_size > 1:
+            start = self.current_page * PAGE_SIZE
+            upcoming = []
+            for idx, track in enumerate(self.queues.upcoming(self.player.guild_id, self.player, start, PAGE_SIZE), start + 1):
+                minutes, seconds = divmod(track.length // 1000, 60)
+                upcoming.append(f"`{idx}.` {track.title} `({minutes:02d}:{seconds:02d})`")
+
+            embed.add_field(
+                name=f"Up Next ({queue_size - 1} tracks)",
+                value="\n".join(upcoming) or "*Nothing on this page*",
+                inline=False
+            )
+
+            total_duration = self.queues.duration(self.player.guild_id, self.player) // 1000
+            hours, remainder = divmod(total_duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            embed.add_field(
+                name="Queue Duration",
+                value=f"{hours}h {minutes}m {seconds}s" if hours > 0 else f"{minutes}m {seconds}s",
+                inline=True
+            )
+
+        status_text = []
+        if self.player.loop:
+            status_text.append("🔁 Loop enabled")
+        if self.player.autoplay:
+            status_text.append("♾️ Autoplay enabled")
+        if self.player.is_paused:
+            status_text.append("⏸️ Paused")
+
+        if status_text:
+            embed.add_field(
+                name="Status",
+                value=" | ".join(status_text),
+                inline=True
+            )
+
+        embed.set_footer(f"Page {self.current_page + 1}/{self.page_count}")
+        return embed
+
+    @miru.button(emoji="◀️", style=hikari.ButtonStyle.SECONDARY, row=0)
+    async def previous_button(self, ctx: miru.ViewContext, button: miru.Button) -> None:
+        self.current_page = max(self.current_page - 1, 0)
+        await self.update_message(ctx)
+
+    @miru.button(emoji="▶️", style=hikari.ButtonStyle.SECONDARY, row=0)
+    async def next_button(self, ctx: miru.ViewContext, button: miru.Button) -> None:
+        self.current_page += 1
+        await self.update_message(ctx)
+
+    async def update_message(self, ctx: miru.ViewContext) -> None:
+        self._update_buttons()
+        await ctx.edit_response(
+            embed=self.render(),
+            components=self.build()
+        )